@@ -6,19 +6,26 @@ A guided app to upload .FIT workout files to your Garmin watch.
 
 import os
 import sys
+import importlib.util
+import mmap
 import shutil
+import signal
 import subprocess
-import webbrowser
 import struct
 import re
 import threading
 import time
-import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from operator import methodcaller
 from pathlib import Path
+from types import MappingProxyType
 from tkinter import *
 from tkinter import ttk, filedialog, messagebox
-from urllib.request import urlopen
-from urllib.error import URLError
+import tkinter.font as tkfont
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
 
 try:
     from version import __version__, __app_name__, __github_repo__
@@ -28,18 +35,23 @@ except ImportError:
     __github_repo__ = "supergeri/garmin-usb-mac-app"
 
 # Try to import tkinterdnd2 for drag and drop support
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-    DND_AVAILABLE = True
-except ImportError:
-    DND_AVAILABLE = False
-
-# Try to import fitparse for FIT file parsing
-try:
-    from fitparse import FitFile
-    FITPARSE_AVAILABLE = True
-except ImportError:
-    FITPARSE_AVAILABLE = False
+# (find_spec first so a missing package doesn't cost a failed import search)
+DND_AVAILABLE = importlib.util.find_spec('tkinterdnd2') is not None
+if DND_AVAILABLE:
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
+    except ImportError:
+        DND_AVAILABLE = False
+
+# FIT readers - only probed here, imported on first parse (they load the full
+# FIT profile tables, which is slow at startup). fitdecode streams the file in
+# one pass and is preferred; fitparse is the fallback
+FITDECODE_AVAILABLE = importlib.util.find_spec('fitdecode') is not None
+FITPARSE_AVAILABLE = importlib.util.find_spec('fitparse') is not None
+
+# pyobjc for in-process USB detection through IOKit (no subprocess) - only probed
+# here, IOKit is loaded on the first device probe (see _get_iokit)
+IOKIT_AVAILABLE = importlib.util.find_spec('objc') is not None
 
 # Try to import amakaflow-fitfiletool for workout repair and FIT parsing
 try:
@@ -64,9 +76,162 @@ except ImportError:
 # Garmin USB Vendor ID
 GARMIN_VENDOR_ID = "0x091e"
 
+# Paths
+HOME = Path.home()
+# Staging folder; GARMIN_STAGING_DIR can point it elsewhere (e.g. a RAM disk)
+STAGING_FOLDER = Path(os.environ.get('GARMIN_STAGING_DIR') or HOME / "GarminWorkouts").expanduser()
+OPENMTP_CANDIDATES = ("/Applications/OpenMTP.app", str(HOME / "Applications/OpenMTP.app"))
+ANDROID_FILE_TRANSFER_APP = "/Applications/Android File Transfer.app"
+
+# System tools used by the device probes (absolute paths skip the PATH search;
+# probes get no stdin and a minimal environment instead of a copy of ours)
+SYSTEM_PROFILER = '/usr/sbin/system_profiler'
+IOREG = '/usr/sbin/ioreg'
+PGREP = '/usr/bin/pgrep'
+PKILL = '/usr/bin/pkill'
+PROBE_ENV = {'PATH': '/usr/sbin:/usr/bin:/bin'}
+
+# Garmin Express processes (matched in executable paths) that hold the watch's MTP session
+GARMIN_EXPRESS_PROCESSES = (b'Garmin Express', b'GarminExpressService')
+
+# Cached GitHub "latest release" response (revalidated with ETag after the TTL)
+UPDATE_CACHE_FILE = HOME / ".cache" / "garmin-uploader" / "latest.json"
+UPDATE_CACHE_TTL = 3600
+
+# Plain "major.minor.patch" release versions, compared as packed ints (20 bits per field)
+VERSION_TRIPLE_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+_packed_versions = {}
+
+# Update download read size (one Python-level read/write per chunk)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Device connection poll interval (doubles up to the max while nothing changes)
+DEVICE_POLL_MS = 3000
+DEVICE_POLL_MAX_MS = 30000
+
+# USB probe output patterns (matched against raw subprocess bytes)
+USB_SIGNATURE_RE = re.compile(rb'"UsbDeviceSignature"\s*=\s*<1e09([a-f0-9]{4})', re.IGNORECASE)
+# Model names must start a word and not run into more letters ("edge" but not "knowledge"/"edgeport");
+# trailing digits are allowed for names like "fenix7"
+GARMIN_NAME_RE = re.compile(
+    rb'\b(?:garmin|forerunner|fenix|edge|vivoactive|venu|instinct|marq|enduro|epix|approach)(?![a-z])',
+    re.IGNORECASE)
+# Garmin vendor ID anywhere in the output (covers "Vendor ID: 0x091e" too - one literal scan)
+GARMIN_VID_RE = re.compile(rb'091e', re.IGNORECASE)
+DEVICE_NAME_RE = re.compile(rb'^\s*(.+?):')
+
+# Little-endian u16 product ID from the USB signature
+unpack_product_id = struct.Struct('<H').unpack_from
+
+# Seconds to reuse system_profiler output between device polls
+SYSTEM_PROFILER_TTL = 10.0
+
+# Seconds a device probe result is reused (back-to-back callers share one probe)
+DEVICE_PROBE_TTL = 1.0
+
+# Max file rows shown in the Listbox; the rest collapse into a "... more" row
+LISTBOX_MAX_VISIBLE = 500
+
+# Parsed workouts kept for the preview windows (keyed by path, mtime and size)
+FIT_CACHE_SIZE = 64
+
+# Parsed workouts persisted across runs, one JSON file per FIT content fingerprint
+# (size + first bytes + trailing CRC), so touched or re-downloaded copies still hit.
+# Bump the version when the parsed layout changes so old entries are ignored
+PARSED_CACHE_DIR = HOME / ".cache" / "garmin-uploader" / "parsed"
+PARSED_CACHE_VERSION = 3
+PARSED_CACHE_HEAD_BYTES = 4096
+
+# Uncached FIT bytes a list view must have before parsing moves to a process pool
+# (each spawned worker re-imports this module, ~1.5 s - small workouts parse in ms)
+PARSE_POOL_MIN_BYTES = 8 * 1024 * 1024
+
+# FIT messages read when parsing a workout (everything else is skipped)
+FIT_WORKOUT_MESSAGES = ('file_id', 'exercise_title', 'workout', 'workout_step')
+
+# Header messages read for the list view's first paint (reading stops at the first step)
+FIT_METADATA_MESSAGES = ('file_id', 'workout', 'workout_step')
+
+# Valid FIT SDK exercise categories are 0-32 (raw numbers outside this are flagged)
+VALID_EXERCISE_CATEGORIES = range(33)
+
+# FIT SDK step intensity (0=active, 1=rest, 2=warmup, 3=cooldown) - the FIT readers
+# return the enum name, or the raw number for values their profile doesn't name
+INTENSITY_ACTIVE = ('active', 0)
+INTENSITY_REST = ('rest', 1)
+INTENSITY_WARMUP = ('warmup', 2)
+INTENSITY_COOLDOWN = ('cooldown', 3)
+
+# Sport / sub-sport values that get the cardio (intensity-based) step naming
+CARDIO_SPORTS = frozenset({
+    'running', 'cycling', 'swimming', 'walking', 'hiking', 'run', 'bike', 'swim',
+    'walk', 'hike', 'cardio', 'trail_running', 'treadmill',
+})
+
+# Files at least this big are memory-mapped by the fallback parser instead of read
+FIT_MMAP_MIN_SIZE = 64 * 1024
+
+# Printable ASCII runs (4+ bytes, ended by a non-printable byte) for the fallback parser
+FIT_TEXT_RUN_RE = re.compile(rb'[\x20-\x7e]{4,}(?=[^\x20-\x7e])')
+# Runs containing one of these are taken as the workout name rather than a step
+FIT_NAME_KEYWORD_RE = re.compile(rb'workout|exercise|run|bike|swim|strength', re.IGNORECASE)
+
+# Per-step field readers for the workout totals (C-level calls when mapped over steps)
+step_duration = methodcaller('get', 'duration', 0)
+step_sets = methodcaller('get', 'sets', 1)
+
+# Preview exercise rows built per event-loop slice (long workouts fill in progressively)
+PREVIEW_ROW_CHUNK = 40
+
+# Preview legend entries (icon, label, color), matching the AmakaFlow app
+PREVIEW_LEGEND = (
+    ("⊙", "Warmup", "#eab308"),
+    ("※", "Warm-Up Set", "#f97316"),
+    ("※", "Exercise", "#fff"),
+    ("↷", "Rest", "#9ca3af"),
+    ("↻", "Repeat", "#3b82f6"),
+)
+
+# Static UI text
+PREPARE_STEPS = """Before transferring, make sure:
+
+✓  Your Garmin watch is connected via USB
+✓  On your watch: Settings → System → USB Mode → MTP
+✓  Accept "Use MTP" prompt on the watch if asked
+✓  Garmin Express is closed (quit it if running)"""
+
+HELP_TEXT = """Why do I need OpenMTP?
+Mac doesn't support MTP (the protocol Garmin uses).
+OpenMTP bridges this gap - it's free and works great.
+
+Watch not showing in OpenMTP?
+• Make sure USB cable supports data (not charge-only)
+• On watch: Settings → System → USB Mode → MTP
+• Quit Garmin Express completely
+• Unplug and replug the watch
+• Click "Refresh" in OpenMTP
+
+Can't find NewFiles folder?
+Look for: GARMIN → NewFiles
+If only "Workouts" exists, use that instead.
+
+Workouts not appearing on watch?
+• Restart your watch after transfer
+• Check: Training → Workouts
+• Make sure files are valid .FIT workout files
+
+Where do workouts come from?
+• Create in Garmin Connect (web or app)
+• Export from TrainingPeaks, Intervals.icu, etc.
+• Download from training plan providers
+
+My files are stuck in GarminWorkouts folder?
+That's just the staging folder on your Mac.
+You still need to drag them to OpenMTP."""
+
 
 # Garmin exercise name mapping (from FIT SDK)
-EXERCISE_NAMES = {
+EXERCISE_NAMES = MappingProxyType({
     # Strength exercises
     0: "Bench Press", 1: "Calf Raise", 2: "Cardio", 3: "Carry", 4: "Chop",
     5: "Core", 6: "Crunch", 7: "Curl", 8: "Deadlift", 9: "Flye",
@@ -78,35 +243,354 @@ EXERCISE_NAMES = {
     31: "Warm Up", 32: "Run", 33: "Unknown", 34: "Rest",
     # Cardio
     65534: "Workout", 65535: "Unknown"
-}
+})
+
+# Known Garmin USB product IDs -> model names
+GARMIN_PRODUCTS = MappingProxyType({
+    # Special modes
+    3: None,  # Charging/initializing mode - handled in _detect_via_ioreg
+
+    # Fenix series
+    20920: "Fenix 8",
+    20921: "Fenix 8 Solar",
+    20922: "Fenix 8 AMOLED",
+    20736: "Fenix 7",
+    20737: "Fenix 7S",
+    20738: "Fenix 7X",
+    20480: "Fenix 6",
+    20481: "Fenix 6S",
+    20482: "Fenix 6X",
+
+    # Forerunner series
+    20224: "Forerunner 965",
+    20096: "Forerunner 265",
+    20097: "Forerunner 265S",
+    19968: "Forerunner 955",
+    19840: "Forerunner 255",
+    19712: "Forerunner 945",
+    19584: "Forerunner 745",
+
+    # Epix
+    20352: "Epix Gen 2",
+    20353: "Epix Pro",
+
+    # Venu
+    19456: "Venu 2",
+    19457: "Venu 2S",
+    19328: "Venu",
+
+    # Instinct
+    19200: "Instinct 2",
+    19201: "Instinct 2S",
+
+    # Edge
+    18944: "Edge 1040",
+    18688: "Edge 840",
+    18432: "Edge 540",
+    18176: "Edge 530",
+})
 
 # Duration type mapping
-DURATION_TYPES = {
+DURATION_TYPES = MappingProxyType({
     0: "time", 1: "distance", 2: "hr_less_than", 3: "hr_greater_than",
     4: "calories", 5: "open", 6: "repeat_until_steps_cmplt",
     7: "repeat_until_time", 8: "repeat_until_distance", 9: "repeat_until_calories",
     10: "repeat_until_hr_less_than", 11: "repeat_until_hr_greater_than",
     12: "repeat_until_power_less_than", 13: "repeat_until_power_greater_than",
     14: "power_less_than", 15: "power_greater_than", 28: "reps"
-}
+})
+# Same table indexed by number (keys are dense), for raw values the FIT reader didn't name
+DURATION_TYPE_NAMES = tuple(map(DURATION_TYPES.get, range(max(DURATION_TYPES) + 1)))
+
+
+@lru_cache(maxsize=None)
+def _get_iokit():
+    """Load the IOKit functions through pyobjc on first use, or None"""
+    try:
+        import objc
+        from Foundation import NSBundle
+        iokit = {}
+        objc.loadBundleFunctions(
+            NSBundle.bundleWithIdentifier_('com.apple.framework.IOKit'), iokit, [
+                ('IOServiceMatching', b'@*'),
+                ('IOServiceGetMatchingServices', b'iI@o^I'),
+                ('IOIteratorNext', b'II'),
+                ('IORegistryEntryCreateCFProperty', b'@I@@I'),
+                ('IOObjectRelease', b'iI'),
+            ])
+    except Exception:
+        return None
+    return iokit if len(iokit) == 5 else None
+
+
+def _iokit_property(iokit, service, key):
+    """Read a registry property from an IOKit service"""
+    return iokit['IORegistryEntryCreateCFProperty'](service, key, None, 0)
+
+
+@lru_cache(maxsize=None)
+def _get_fitparse():
+    """Import fitparse's FitFile on first use"""
+    from fitparse import FitFile
+    return FitFile
+
+
+def iter_fit_messages(filepath, names):
+    """Yield the FIT data messages named in names, in file order.
+    Messages from either reader have .name and .fields (each with .name and .value)."""
+    if FITDECODE_AVAILABLE:
+        import fitdecode
+        with fitdecode.FitReader(filepath) as fit:
+            for frame in fit:
+                if frame.frame_type == fitdecode.FIT_FRAME_DATA and frame.name in names:
+                    yield frame
+    else:
+        yield from _get_fitparse()(filepath).get_messages(names)
+
+
+def open_url(url):
+    """Open a URL in the default browser (webbrowser is only imported on first use)"""
+    import webbrowser
+    webbrowser.open(url)
+
+
+def is_fit_file(path):
+    """Check for a .fit extension (lowercases only the suffix, not the whole path)"""
+    return path[-4:].lower() == '.fit'
+
+
+@lru_cache(maxsize=1024)
+def pretty_name(token):
+    """FIT enum token to display text ('leg_curl' -> 'Leg Curl'), memoized per token"""
+    return token.replace('_', ' ').title()
+
+
+def _format_duration_text(seconds):
+    """Duration text for format_duration ('45s', '1:30', '5min', '1h 5m')"""
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    elif seconds < 3600:
+        mins = int(seconds // 60)
+        secs = int(seconds % 60)
+        return f"{mins}:{secs:02d}" if secs else f"{mins}min"
+    else:
+        hours = int(seconds // 3600)
+        mins = int((seconds % 3600) // 60)
+        return f"{hours}h {mins}m" if mins else f"{hours}h"
+
+
+# Text for every whole second under an hour - the range of nearly all step durations
+DURATION_TEXT = tuple(map(_format_duration_text, range(3600)))
+
+
+def write_file_atomic(path, text):
+    """Write text to path via a temp file in the same folder and a rename, so readers
+    never see a half-written file (raises OSError)"""
+    import tempfile
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+
+def replace_app_bundle(app_source, app_dest):
+    """Replace the .app at app_dest with a copy of app_source (raises OSError).
+    The copy is made in a sibling folder and swapped in, so a failed copy leaves the old app."""
+    import tempfile
+    staging = tempfile.mkdtemp(prefix='.update-', dir=os.path.dirname(app_dest))
+    new_app = os.path.join(staging, os.path.basename(app_dest))
+    old_app = os.path.join(staging, 'previous.app')
+    try:
+        try:
+            # In-process copy; symlinks inside the bundle stay symlinks
+            shutil.copytree(app_source, new_app, symlinks=True)
+        except OSError:
+            # Fall back to cp -R (also copies resource forks and extended attributes)
+            shutil.rmtree(new_app, ignore_errors=True)
+            result = subprocess.run(['cp', '-R', app_source, new_app], capture_output=True, text=True)
+            if result.returncode != 0:
+                raise OSError(result.stderr.strip() or "cp -R failed")
+        
+        # Swap: move the old app aside, then the new one into place (same volume renames)
+        if os.path.exists(app_dest):
+            os.rename(app_dest, old_app)
+        try:
+            os.rename(new_app, app_dest)
+        except OSError:
+            if os.path.exists(old_app):
+                os.rename(old_app, app_dest)
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def launch_detached(args):
+    """Start a helper command (open, pkill) without waiting for it to exit"""
+    # Own session, so the helper isn't tied to our process group (e.g. an app relaunch)
+    return subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, close_fds=True, start_new_session=True)
+
+
+@lru_cache(maxsize=None)
+def _get_clonefile():
+    """Look up libc clonefile(2) (APFS copy-on-write clone, macOS only) on first use"""
+    import ctypes
+    try:
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    return clonefile
+
+
+@lru_cache(maxsize=None)
+def _get_libproc():
+    """Load macOS libproc (process listing without spawning pgrep) on first use, or None"""
+    import ctypes
+    try:
+        libproc = ctypes.CDLL('/usr/lib/libproc.dylib', use_errno=True)
+        libproc.proc_listpids.argtypes = (ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_int)
+        libproc.proc_pidpath.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_uint32)
+    except (OSError, AttributeError):
+        return None
+    return libproc
+
+
+def find_process_ids(names):
+    """PIDs whose executable path contains any of names (bytes), or None if libproc
+    is unavailable and the caller should fall back to pgrep/pkill"""
+    import ctypes
+    libproc = _get_libproc()
+    if libproc is None:
+        return None
+    PROC_ALL_PIDS = 1
+    # First call sizes the buffer; leave headroom for processes started in between
+    needed = libproc.proc_listpids(PROC_ALL_PIDS, 0, None, 0)
+    if needed <= 0:
+        return None
+    pids = (ctypes.c_int * (needed // ctypes.sizeof(ctypes.c_int) + 64))()
+    used = libproc.proc_listpids(PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+    if used <= 0:
+        return None
+    path = ctypes.create_string_buffer(4096)  # PROC_PIDPATHINFO_MAXSIZE
+    found = []
+    for pid in pids[:used // ctypes.sizeof(ctypes.c_int)]:
+        if pid > 0 and libproc.proc_pidpath(pid, path, len(path)) > 0:
+            if any(name in path.value for name in names):
+                found.append(pid)
+    return found
+
+
+def _copy_one(src, dest, filename):
+    """Copy a single file to the staging folder. Returns (filename, error)."""
+    try:
+        # Same APFS volume (the usual case under ~): clone without copying any data
+        clonefile = _get_clonefile()
+        if clonefile and clonefile(os.fsencode(src), os.fsencode(dest), 0) == 0:
+            return filename, None
+        # Otherwise (other volume, not APFS, dest exists) copy the contents only -
+        # staged copies don't need mtime/xattrs, and copyfile uses fcopyfile on macOS
+        shutil.copyfile(src, dest)
+        return filename, None
+    except Exception as e:
+        return filename, e
+
+
+_styles_installed = False
+
+
+def _install_styles(root):
+    """Configure the shared ttk styles (Style is a per-interpreter singleton, so only once)"""
+    global _styles_installed
+    if _styles_installed:
+        return
+    style = ttk.Style(root)
+    style.configure("Title.TLabel", font=('SF Pro Display', 22, 'bold'), background='#f5f5f7')
+    style.configure("Subtitle.TLabel", font=('SF Pro Text', 12), background='#f5f5f7', foreground='#666')
+    style.configure("Step.TLabel", font=('SF Pro Text', 11), background='#fff')
+    style.configure("StepNum.TLabel", font=('SF Pro Display', 14, 'bold'), background='#007AFF', foreground='white')
+    style.configure("Big.TButton", font=('SF Pro Text', 13), padding=12)
+    style.configure("Card.TFrame", background='#fff')
+    style.configure("Workouts.Treeview", font=('SF Pro Text', 12), rowheight=28,
+                    background='#222', fieldbackground='#222', foreground='#fff')
+    style.configure("Workouts.Treeview.Heading", font=('SF Pro Text', 11, 'bold'))
+    style.map("Workouts.Treeview", background=[('selected', '#007AFF')])
+    _styles_installed = True
 
 
 class UpdateChecker:
     """Check for app updates from GitHub releases"""
 
+    @staticmethod
+    def _pack_version(v):
+        """Pack a plain "x.y.z" version into one int, or None for anything else (cached)"""
+        try:
+            return _packed_versions[v]
+        except KeyError:
+            pass
+        m = VERSION_TRIPLE_RE.fullmatch(v)
+        packed = None
+        if m:
+            major, minor, patch = map(int, m.groups())
+            if max(major, minor, patch) < 1 << 20:
+                packed = (major << 40) | (minor << 20) | patch
+        _packed_versions[v] = packed
+        return packed
+
     @staticmethod
     def _compare_versions(v1, v2):
         """Compare two version strings properly (handles 1.0.10 > 1.0.9)"""
+        p1, p2 = UpdateChecker._pack_version(v1), UpdateChecker._pack_version(v2)
+        if p1 is not None and p2 is not None:
+            return p1 > p2
+
+        try:
+            from packaging.version import Version, InvalidVersion
+            try:
+                return Version(v1) > Version(v2)
+            except InvalidVersion:
+                pass
+        except ImportError:
+            pass
+
         def parse_version(v):
-            return [int(x) for x in v.split('.')]
+            # Numeric prefix of each component, so "1.0.10-beta" never falls back to a string compare
+            return tuple(int(m.group()) if m else 0
+                         for m in (re.match(r'\d+', x) for x in v.split('.')))
+        return parse_version(v1) > parse_version(v2)
+
+    @staticmethod
+    def _load_release_cache():
+        """Load the cached latest-release response, or None"""
+        import json
+        try:
+            with open(UPDATE_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save_release_cache(cache):
+        """Persist the latest-release response (best effort, written atomically)"""
+        import json
         try:
-            return parse_version(v1) > parse_version(v2)
-        except (ValueError, AttributeError):
-            return v1 > v2
+            write_file_atomic(UPDATE_CACHE_FILE, json.dumps(cache))
+        except OSError:
+            pass
 
     @staticmethod
-    def check_for_updates():
-        """Check if a new version is available on GitHub"""
+    def _fetch_latest_release(force=False):
+        """Get the latest release JSON, using the disk cache and ETag revalidation"""
+        cached = UpdateChecker._load_release_cache()
+        if cached and not force and time.time() - cached.get('fetched', 0) < UPDATE_CACHE_TTL:
+            return cached['data']
+
+        import json
         import ssl
         try:
             import certifi
@@ -114,25 +598,51 @@ class UpdateChecker:
         except ImportError:
             # Fallback if certifi not available (shouldn't happen in bundled app)
             ssl_context = ssl.create_default_context()
+
+        url = f"https://api.github.com/repos/{__github_repo__}/releases/latest"
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
         try:
-            url = f"https://api.github.com/repos/{__github_repo__}/releases/latest"
-            with urlopen(url, timeout=10, context=ssl_context) as response:
+            with urlopen(Request(url, headers=headers), timeout=10, context=ssl_context) as response:
                 data = json.loads(response.read().decode())
-                latest_version = data['tag_name'].lstrip('v')
-                download_url = None
+                etag = response.headers.get('ETag')
+        except HTTPError as e:
+            # 304 Not Modified - the cached body is still current
+            if e.code != 304 or not cached:
+                raise
+            cached['fetched'] = time.time()
+            UpdateChecker._save_release_cache(cached)
+            return cached['data']
+
+        UpdateChecker._save_release_cache({'fetched': time.time(), 'etag': etag, 'data': data})
+        return data
 
-                for asset in data.get('assets', []):
-                    if asset['name'].endswith('.dmg') or asset['name'].endswith('.pkg'):
+    @staticmethod
+    def check_for_updates(force=False):
+        """Check if a new version is available on GitHub"""
+        try:
+            data = UpdateChecker._fetch_latest_release(force)
+            latest_version = data['tag_name'].lstrip('v')
+            download_url = None
+
+            # Prefer a .dmg; otherwise take the first .pkg
+            for asset in data.get('assets', ()):
+                name = asset['name']
+                if name.endswith(('.dmg', '.pkg')):
+                    if name.endswith('.dmg'):
                         download_url = asset['browser_download_url']
                         break
+                    if download_url is None:
+                        download_url = asset['browser_download_url']
 
-                return {
-                    'available': UpdateChecker._compare_versions(latest_version, __version__),
-                    'version': latest_version,
-                    'url': download_url,  # None if no DMG/PKG asset found
-                    'release_url': data['html_url'],  # For manual download fallback
-                    'notes': data.get('body', '')
-                }
+            return {
+                'available': UpdateChecker._compare_versions(latest_version, __version__),
+                'version': latest_version,
+                'url': download_url,  # None if no DMG/PKG asset found
+                'release_url': data['html_url'],  # For manual download fallback
+                'notes': data.get('body', '')
+            }
         except Exception as e:
             print(f"Update check error: {e}")
             return None
@@ -154,17 +664,27 @@ class UpdateChecker:
 
             with urlopen(url, timeout=60, context=ssl_context) as response:
                 total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
 
                 with open(temp_file, 'wb') as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if callback and total_size:
-                            callback(downloaded / total_size)
+                    if not (callback and total_size):
+                        # Nothing to report - let copyfileobj stream it
+                        shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+                    else:
+                        # Read into one reused buffer; report progress once per whole percent
+                        buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+                        view = memoryview(buf)
+                        downloaded = 0
+                        reported = -1
+                        while True:
+                            n = response.readinto(buf)
+                            if not n:
+                                break
+                            f.write(view[:n])
+                            downloaded += n
+                            percent = downloaded * 100 // total_size
+                            if percent != reported:
+                                reported = percent
+                                callback(downloaded / total_size)
 
             return temp_file
         except Exception as e:
@@ -182,25 +702,41 @@ class GarminUploaderMac:
         # Styling
         self.root.configure(bg='#f5f5f7')
         
-        self.style = ttk.Style()
-        self.style.configure("Title.TLabel", font=('SF Pro Display', 22, 'bold'), background='#f5f5f7')
-        self.style.configure("Subtitle.TLabel", font=('SF Pro Text', 12), background='#f5f5f7', foreground='#666')
-        self.style.configure("Step.TLabel", font=('SF Pro Text', 11), background='#fff')
-        self.style.configure("StepNum.TLabel", font=('SF Pro Display', 14, 'bold'), background='#007AFF', foreground='white')
-        self.style.configure("Big.TButton", font=('SF Pro Text', 13), padding=12)
-        self.style.configure("Card.TFrame", background='#fff')
+        # Shared fonts - Tk resolves each once and reuses it across widgets
+        self.font_small = tkfont.Font(family='SF Pro Text', size=9)
+        self.font_caption = tkfont.Font(family='SF Pro Text', size=10)
+        self.font_caption_bold = tkfont.Font(family='SF Pro Text', size=10, weight='bold')
+        self.font_body = tkfont.Font(family='SF Pro Text', size=11)
+        self.font_body_bold = tkfont.Font(family='SF Pro Text', size=11, weight='bold')
+        self.font_large = tkfont.Font(family='SF Pro Text', size=12)
+        self.font_large_bold = tkfont.Font(family='SF Pro Text', size=12, weight='bold')
+        self.font_heading = tkfont.Font(family='SF Pro Text', size=13, weight='bold')
+        self.font_title = tkfont.Font(family='SF Pro Display', size=18, weight='bold')
+        self.font_link = tkfont.Font(family='SF Pro Text', size=11, underline=True)
+        self.font_step_number = tkfont.Font(family='SF Pro Display', size=13, weight='bold')
+        self.font_watch_title = tkfont.Font(family='SF Pro Display', size=14, weight='bold')
+        self.font_watch_title_large = tkfont.Font(family='SF Pro Display', size=16, weight='bold')
+        self._text_sizes = {}  # (font name, text) -> (width, linespace), see _text_size
+        
+        _install_styles(self.root)
         
         # Paths
-        self.home = Path.home()
-        self.staging_folder = self.home / "GarminWorkouts"
-        self.staging_folder.mkdir(exist_ok=True)
-        
-        self.selected_files = []
+        self.home = HOME
+        self.staging_folder = STAGING_FOLDER
+        self.staging_folder.mkdir(parents=True, exist_ok=True)
+        
+        self.selected_files = []  # (full_path, basename) tuples
+        self._selected_set = set()  # Mirrors selected_files for O(1) dedup
+        self._listbox_shown = 0  # Files with a Listbox row (capped at LISTBOX_MAX_VISIBLE)
+        self._openmtp_path = None  # Resolved OpenMTP.app path, cached by check_openmtp
         self.openmtp_installed = self.check_openmtp()
         self.libmtp_installed = self.check_libmtp()
         
         # Track drag state for visual feedback
         self.is_dragging = False
+        self._flash_pending = False
+        self._ui_update_scheduled = False
+        self._staging = False  # True while _stage_worker runs (keeps the Stage button disabled)
         
         # UI elements initialized later
         self.close_ge_btn = None
@@ -208,13 +744,25 @@ class GarminUploaderMac:
         self._monitor_running = True
         self.transfer_btns_frame = None
         self.openmtp_warning_frame = None
+        self._help_window = None
+        self._fit_cache = OrderedDict()  # (path, mtime_ns, size) -> parsed workout
+        self._fit_cache_lock = threading.Lock()  # Previews parse on worker threads
 
         # Track connected device for model-specific adjustments
         self.current_device = None
+        self._device_state = None  # (name, mode, ge_running) from the last refresh
+        self._poll_interval = DEVICE_POLL_MS
+        self._monitor_after_id = None
+        self._sp_cache = {'ts': 0.0, 'out': None, 'rc': None}  # Last system_profiler result
+        self._device_cache = {'ts': 0.0, 'device': None}  # Last detect_garmin_device result
+        self._sp_fallback = False  # Device last seen only by system_profiler - keep polling it
+        self._probe_pool = ThreadPoolExecutor(max_workers=2)  # Device status probes
+        self._probe_seq = 0  # Last refresh started / applied (an older probe never overwrites a newer one)
+        self._probe_applied = 0
 
         # Connect IQ app installation
         self.selected_prg_file = None
-        self.prg_build_folder = Path.home() / "dev" / "amakaflow-garmin-app" / "bin"
+        self.prg_build_folder = HOME / "dev" / "amakaflow-garmin-app" / "bin"
         self.garmin_mount = None
 
         # Handle window close
@@ -229,6 +777,7 @@ class GarminUploaderMac:
     def _on_close(self):
         """Handle window close"""
         self._monitor_running = False
+        self._probe_pool.shutdown(wait=False)
         self.root.destroy()
 
     def _check_updates(self):
@@ -244,17 +793,17 @@ class GarminUploaderMac:
         update_frame.pack(fill=X, side=TOP, before=self.root.winfo_children()[0])
 
         Label(update_frame, text=f"Update Available: v{update_info['version']}",
-              font=('SF Pro Text', 11, 'bold'), bg='#4CAF50', fg='white').pack(side=LEFT)
+              font=self.font_body_bold, bg='#4CAF50', fg='white').pack(side=LEFT)
 
-        Button(update_frame, text="Download Update", font=('SF Pro Text', 10),
+        Button(update_frame, text="Download Update", font=self.font_caption,
                bg='white', fg='#4CAF50', relief=FLAT, padx=12, pady=4,
                cursor='hand2',
                command=lambda: self._download_and_install(update_info)).pack(side=RIGHT, padx=(0, 5))
 
-        Button(update_frame, text="View Release Notes", font=('SF Pro Text', 10),
+        Button(update_frame, text="View Release Notes", font=self.font_caption,
                bg='#45A049', fg='white', relief=FLAT, padx=12, pady=4,
                cursor='hand2',
-               command=lambda: webbrowser.open(f"https://github.com/{__github_repo__}/releases/latest")).pack(side=RIGHT)
+               command=partial(open_url, f"https://github.com/{__github_repo__}/releases/latest")).pack(side=RIGHT)
 
     def _download_and_install(self, update_info, skip_confirm=False):
         """Download and install update"""
@@ -268,7 +817,7 @@ class GarminUploaderMac:
                 "Would you like to open the release page to download manually?"
             )
             if response:
-                webbrowser.open(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
+                open_url(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
             return
 
         if not skip_confirm:
@@ -287,7 +836,7 @@ class GarminUploaderMac:
         progress_window.resizable(False, False)
         progress_window.transient(self.root)
 
-        Label(progress_window, text="Downloading update...", font=('SF Pro Text', 11)).pack(pady=10)
+        Label(progress_window, text="Downloading update...", font=self.font_body).pack(pady=10)
 
         progress_bar = ttk.Progressbar(progress_window, length=350, mode='determinate')
         progress_bar.pack(pady=10)
@@ -311,34 +860,29 @@ class GarminUploaderMac:
                         "Would you like to open the release page to download manually?"
                     )
                     if response:
-                        webbrowser.open(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
+                        open_url(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
                     return
 
             if installer_path and installer_path.endswith('.dmg'):
                 # Auto-install from DMG
                 try:
-                    # Mount the DMG and get mount point from output
+                    # Mount the DMG and get mount point from hdiutil's plist output
                     mount_result = subprocess.run(
-                        ['hdiutil', 'attach', installer_path, '-nobrowse'],
-                        capture_output=True, text=True
+                        ['hdiutil', 'attach', installer_path, '-nobrowse', '-plist'],
+                        capture_output=True
                     )
                     if mount_result.returncode != 0:
-                        raise Exception(f"Failed to mount DMG: {mount_result.stderr}")
-
-                    # Parse mount point from output (last line contains the volume path)
-                    mount_point = None
-                    for line in mount_result.stdout.strip().split('\n'):
-                        if '/Volumes/' in line:
-                            # Extract the path after /Volumes/
-                            parts = line.split('\t')
-                            for part in parts:
-                                if '/Volumes/' in part:
-                                    mount_point = part.strip()
-                                    break
+                        raise Exception(f"Failed to mount DMG: {mount_result.stderr.decode(errors='replace')}")
+
+                    import plistlib
+                    try:
+                        entities = plistlib.loads(mount_result.stdout).get('system-entities', [])
+                        mount_point = next((e['mount-point'] for e in entities if 'mount-point' in e), None)
+                    except Exception:
+                        mount_point = None  # Unexpected output - try the known volume names
 
                     # Fallback: check known volume names
                     if not mount_point or not os.path.exists(mount_point):
-                        import time
                         time.sleep(1)  # Wait for mount to complete
                         for vol in ['/Volumes/Garmin Workout Uploader', '/Volumes/GarminWorkoutUploader']:
                             if os.path.exists(vol):
@@ -348,12 +892,11 @@ class GarminUploaderMac:
                     if not mount_point or not os.path.exists(mount_point):
                         raise Exception("Could not find mounted volume")
 
-                    # Find the .app in the mounted volume
-                    app_source = None
-                    for item in os.listdir(mount_point):
-                        if item.endswith('.app'):
-                            app_source = os.path.join(mount_point, item)
-                            break
+                    # Find the .app bundle in the mounted volume (d_type from readdir, no stat per entry)
+                    with os.scandir(mount_point) as it:
+                        app_source = next((entry.path for entry in it
+                                           if entry.name.endswith('.app') and entry.is_dir(follow_symlinks=False)),
+                                          None)
 
                     if not app_source:
                         raise Exception("Could not find app in DMG")
@@ -386,25 +929,18 @@ class GarminUploaderMac:
 
                     # Try to remove old app and copy new one
                     try:
-                        if os.path.exists(app_dest):
-                            subprocess.run(['rm', '-rf', app_dest], check=True)
-
-                        copy_result = subprocess.run(['cp', '-R', app_source, app_dest], capture_output=True, text=True)
-                        if copy_result.returncode != 0:
-                            raise PermissionError(copy_result.stderr)
-                    except (PermissionError, subprocess.CalledProcessError) as perm_err:
+                        replace_app_bundle(app_source, app_dest)
+                    except OSError as perm_err:
                         # Permission denied - fall back to ~/Applications
                         home_apps = os.path.expanduser('~/Applications')
                         os.makedirs(home_apps, exist_ok=True)
                         app_dest = os.path.join(home_apps, 'Garmin Workout Uploader.app')
                         install_location = "~/Applications"
 
-                        if os.path.exists(app_dest):
-                            subprocess.run(['rm', '-rf', app_dest], check=True)
-
-                        copy_result = subprocess.run(['cp', '-R', app_source, app_dest], capture_output=True, text=True)
-                        if copy_result.returncode != 0:
-                            raise Exception(f"Failed to copy app: {copy_result.stderr}")
+                        try:
+                            replace_app_bundle(app_source, app_dest)
+                        except OSError as e:
+                            raise Exception(f"Failed to copy app: {e}")
 
                     # Unmount the DMG
                     subprocess.run(['hdiutil', 'detach', mount_point, '-quiet', '-force'])
@@ -418,12 +954,12 @@ class GarminUploaderMac:
                     )
                     if response:
                         # Relaunch the app
-                        subprocess.Popen(['open', app_dest])
+                        launch_detached(['open', app_dest])
                         self.root.quit()
 
                 except Exception as e:
                     # Fallback to manual install
-                    subprocess.run(['open', installer_path])
+                    launch_detached(['open', installer_path])
                     messagebox.showinfo("Auto-Install Issue",
                         f"Auto-install encountered an issue:\n{str(e)}\n\n"
                         f"The DMG has been opened. Please drag the app to Applications manually.")
@@ -435,7 +971,7 @@ class GarminUploaderMac:
                     "Would you like to open the release page to download manually?"
                 )
                 if response:
-                    webbrowser.open(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
+                    open_url(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
             else:
                 response = messagebox.askyesno(
                     "Download Failed",
@@ -443,7 +979,7 @@ class GarminUploaderMac:
                     "Would you like to open the release page to download manually?"
                 )
                 if response:
-                    webbrowser.open(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
+                    open_url(update_info.get('release_url', f"https://github.com/{__github_repo__}/releases/latest"))
 
         threading.Thread(target=do_download, daemon=True).start()
 
@@ -464,10 +1000,10 @@ class GarminUploaderMac:
         checking_window.geometry(f"+{x}+{y}")
 
         Label(checking_window, text="🔄 Checking for updates...",
-              font=('SF Pro Text', 12)).pack(expand=True)
+              font=self.font_large).pack(expand=True)
 
         def do_check():
-            update_info = UpdateChecker.check_for_updates()
+            update_info = UpdateChecker.check_for_updates(force=True)
             self.root.after(0, lambda: show_result(update_info))
 
         def show_result(update_info):
@@ -494,77 +1030,126 @@ class GarminUploaderMac:
         threading.Thread(target=do_check, daemon=True).start()
 
     def check_openmtp(self):
-        """Check if OpenMTP is installed"""
-        paths = [
-            Path("/Applications/OpenMTP.app"),
-            self.home / "Applications/OpenMTP.app"
-        ]
-        return any(p.exists() for p in paths)
+        """Check if OpenMTP is installed (caches the resolved path)"""
+        for path in OPENMTP_CANDIDATES:
+            if os.path.exists(path):
+                self._openmtp_path = path
+                return True
+        self._openmtp_path = None
+        return False
     
     def check_libmtp(self):
         """Check if libmtp is installed via Homebrew"""
-        try:
-            result = subprocess.run(['which', 'mtp-detect'], 
-                                   capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+        return shutil.which('mtp-detect') is not None
     
-    def detect_garmin_device(self):
-        """Detect connected Garmin device via USB"""
-        # Try system_profiler first
-        device = self._detect_via_system_profiler()
+    def detect_garmin_device(self, deep=False):
+        """Detect connected Garmin device via USB (reused for DEVICE_PROBE_TTL seconds).
+        deep also falls back to system_profiler if the fast probes find nothing."""
+        cache = self._device_cache
+        if not deep and time.monotonic() - cache['ts'] < DEVICE_PROBE_TTL:
+            return cache['device']
+        device = self._probe_garmin_device(deep)
+        cache.update(ts=time.monotonic(), device=device)
+        return device
+    
+    def _probe_garmin_device(self, deep=False):
+        """Run the USB probes for a connected Garmin device"""
+        # Query IOKit in-process when pyobjc is available; ioreg reads the same
+        # registry, so it is only needed without pyobjc or if IOKit errors out
+        device = None
+        iokit = _get_iokit() if IOKIT_AVAILABLE else None
+        if iokit is not None:
+            try:
+                device = self._detect_via_iokit(iokit)
+            except Exception:
+                iokit = None  # IOKit errored - use ioreg instead
+        if iokit is None:
+            # Try ioreg (fast, and reports MTP/charging mode)
+            device = self._detect_via_ioreg()
+        
+        # Only a found device ends the probe; a deep scan still falls through below
         if device:
             return device
         
-        # Fallback to ioreg for MTP devices
-        device = self._detect_via_ioreg()
-        if device:
+        # The much slower system_profiler only runs on a deep scan (Refresh button), and
+        # on the background poll only while it is the one probe that sees the device
+        if deep or self._sp_fallback:
+            device = self._detect_via_system_profiler()
+            self._sp_fallback = device is not None
             return device
         
         return None
     
+    def _detect_via_iokit(self, iokit):
+        """Detect Garmin via IOKit (pyobjc) without spawning a process.
+        Raises on IOKit errors so the caller can fall back to the CLI probes."""
+        for usb_class in (b'IOUSBHostDevice', b'IOUSBDevice'):
+            kr, iterator = iokit['IOServiceGetMatchingServices'](
+                0, iokit['IOServiceMatching'](usb_class), None)
+            if kr != 0:
+                continue
+            try:
+                while True:
+                    service = iokit['IOIteratorNext'](iterator)
+                    if not service:
+                        break
+                    try:
+                        if _iokit_property(iokit, service, 'idVendor') != 0x091E:
+                            continue
+                        product_id = int(_iokit_property(iokit, service, 'idProduct') or 0)
+                        if product_id == 3:
+                            return {
+                                'connected': True,
+                                'name': "Garmin Watch (initializing...)",
+                                'vendor_id': '091e',
+                                'product_id': product_id,
+                                'mode': 'charging'
+                            }
+                        name = _iokit_property(iokit, service, 'USB Product Name')
+                        return {
+                            'connected': True,
+                            'name': str(name) if name else f"Garmin Watch (ID:{product_id})",
+                            'vendor_id': '091e',
+                            'product_id': product_id,
+                            'mode': 'mtp'
+                        }
+                    finally:
+                        iokit['IOObjectRelease'](service)
+            finally:
+                iokit['IOObjectRelease'](iterator)
+        return None
+    
     def _detect_via_system_profiler(self):
         """Detect Garmin via system_profiler"""
         try:
-            result = subprocess.run(
-                ['system_profiler', 'SPUSBDataType'],
-                capture_output=True, text=True, timeout=10
-            )
+            # system_profiler is slow - reuse its output for SYSTEM_PROFILER_TTL seconds
+            cache = self._sp_cache
+            if time.monotonic() - cache['ts'] >= SYSTEM_PROFILER_TTL:
+                result = subprocess.run(
+                    [SYSTEM_PROFILER, '-detailLevel', 'mini', 'SPUSBDataType'],
+                    stdin=subprocess.DEVNULL, capture_output=True, timeout=10, env=PROBE_ENV
+                )
+                cache.update(ts=time.monotonic(), out=result.stdout, rc=result.returncode)
             
-            if result.returncode != 0:
+            if cache['rc'] != 0:
                 return None
             
-            output = result.stdout
-            output_lower = output.lower()
-            
-            # Look for Garmin device patterns
-            garmin_patterns = [
-                'garmin', 'forerunner', 'fenix', 'edge', 'vivoactive', 
-                'venu', 'instinct', 'marq', 'enduro', 'epix', 'approach'
-            ]
-            
-            # Check if any Garmin-related text exists
-            found = any(p in output_lower for p in garmin_patterns)
+            # Scan the raw bytes - no decode or lower-cased copy of the buffer
+            output = cache['out']
             
-            # Also check vendor ID (0x091e)
-            if not found:
-                found = 'vendor id: 0x091e' in output_lower or '091e' in output_lower
-            
-            if not found:
+            # Check if any Garmin-related text exists, or the vendor ID (0x091e)
+            hit = GARMIN_NAME_RE.search(output)
+            if not (hit or GARMIN_VID_RE.search(output)):
                 return None
             
-            # Try to extract device name
-            lines = output.split('\n')
+            # Try to extract device name from the line containing the first hit
             device_name = None
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
-                if any(g in line_lower for g in garmin_patterns):
-                    name_match = re.search(r'^\s*(.+?):', line)
-                    if name_match:
-                        device_name = name_match.group(1).strip()
-                    break
+            if hit:
+                start = output.rfind(b'\n', 0, hit.start()) + 1
+                end = output.find(b'\n', hit.end())
+                name_match = DEVICE_NAME_RE.search(output[start:end if end != -1 else None])
+                if name_match:
+                    device_name = name_match.group(1).strip().decode('utf-8', 'replace')
             
             return {
                 'connected': True,
@@ -579,8 +1164,8 @@ class GarminUploaderMac:
         """Detect Garmin via ioreg (for MTP devices)"""
         try:
             result = subprocess.run(
-                ['ioreg', '-p', 'IOUSB', '-l', '-w', '0'],
-                capture_output=True, text=True, timeout=10
+                [IOREG, '-p', 'IOUSB', '-l', '-w', '0'],
+                stdin=subprocess.DEVNULL, capture_output=True, timeout=10, env=PROBE_ENV
             )
             
             if result.returncode != 0:
@@ -591,59 +1176,13 @@ class GarminUploaderMac:
             # Look for Garmin signature directly in the output
             # Signature format: <1e09XXYY...> where 1e09 is Garmin vendor ID (little-endian)
             # and XXYY is product ID (little-endian)
-            sig_pattern = re.search(r'"UsbDeviceSignature"\s*=\s*<1e09([a-f0-9]{4})', output, re.IGNORECASE)
+            sig_pattern = USB_SIGNATURE_RE.search(output)
             
             if not sig_pattern:
                 return None
             
             # Extract product ID from signature (little-endian)
-            hex_pid = sig_pattern.group(1)
-            product_id = int(hex_pid[2:4] + hex_pid[0:2], 16)
-            
-            # Map known Garmin product IDs to names
-            garmin_products = {
-                # Special modes
-                3: None,  # Charging/initializing mode - will be handled below
-                
-                # Fenix series
-                20920: "Fenix 8",
-                20921: "Fenix 8 Solar",
-                20922: "Fenix 8 AMOLED",
-                20736: "Fenix 7",
-                20737: "Fenix 7S",
-                20738: "Fenix 7X",
-                20480: "Fenix 6",
-                20481: "Fenix 6S",
-                20482: "Fenix 6X",
-                
-                # Forerunner series
-                20224: "Forerunner 965",
-                20096: "Forerunner 265",
-                20097: "Forerunner 265S", 
-                19968: "Forerunner 955",
-                19840: "Forerunner 255",
-                19712: "Forerunner 945",
-                19584: "Forerunner 745",
-                
-                # Epix
-                20352: "Epix Gen 2",
-                20353: "Epix Pro",
-                
-                # Venu
-                19456: "Venu 2",
-                19457: "Venu 2S",
-                19328: "Venu",
-                
-                # Instinct
-                19200: "Instinct 2",
-                19201: "Instinct 2S",
-                
-                # Edge
-                18944: "Edge 1040",
-                18688: "Edge 840",
-                18432: "Edge 540",
-                18176: "Edge 530",
-            }
+            (product_id,) = unpack_product_id(bytes.fromhex(sig_pattern.group(1).decode('ascii')))
             
             # Handle special modes
             if product_id == 3:
@@ -654,10 +1193,8 @@ class GarminUploaderMac:
                     'product_id': product_id,
                     'mode': 'charging'
                 }
-            elif product_id in garmin_products:
-                device_name = garmin_products[product_id]
             else:
-                device_name = f"Garmin Watch (ID:{product_id})"
+                device_name = GARMIN_PRODUCTS.get(product_id) or f"Garmin Watch (ID:{product_id})"
             
             return {
                 'connected': True,
@@ -672,24 +1209,36 @@ class GarminUploaderMac:
     
     def check_garmin_express_running(self):
         """Check if Garmin Express is running (blocks MTP)"""
+        pids = find_process_ids(GARMIN_EXPRESS_PROCESSES)
+        if pids is not None:
+            return bool(pids)
         try:
-            result = subprocess.run(['pgrep', '-f', 'Garmin Express'],
-                                   capture_output=True, text=True, timeout=5)
+            result = subprocess.run([PGREP, '-f', 'Garmin Express'], stdin=subprocess.DEVNULL,
+                                   capture_output=True, timeout=5, env=PROBE_ENV)
             return result.returncode == 0
         except:
             return False
     
     def kill_garmin_express(self):
         """Kill Garmin Express if running"""
+        pids = find_process_ids(GARMIN_EXPRESS_PROCESSES)
+        if pids is not None:
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass  # Already gone, or not ours to signal
+            return True
         try:
-            subprocess.run(['pkill', '-f', 'Garmin Express'], timeout=5, capture_output=True)
-            subprocess.run(['pkill', '-f', 'GarminExpressService'], timeout=5, capture_output=True)
+            launch_detached([PKILL, '-f', 'Garmin Express'])
+            launch_detached([PKILL, '-f', 'GarminExpressService'])
             return True
         except:
             return False
     
-    def refresh_device_status(self):
-        """Refresh the device connection status"""
+    def refresh_device_status(self, deep=False, on_done=None):
+        """Refresh the device connection status without blocking the UI (deep: see
+        detect_garmin_device). on_done(changed) runs on the main thread afterwards."""
         # Check if widgets still exist
         try:
             if not self.device_status.winfo_exists():
@@ -697,11 +1246,44 @@ class GarminUploaderMac:
         except:
             return
         
-        device = self.detect_garmin_device()
-        garmin_express_running = self.check_garmin_express_running()
-
+        # Run the USB probe and the Garmin Express check concurrently, off the Tk thread
+        self._probe_seq += 1
+        seq = self._probe_seq
+        device_future = self._probe_pool.submit(self.detect_garmin_device, deep)
+        ge_future = self._probe_pool.submit(self.check_garmin_express_running)
+        
+        def post(_):
+            try:
+                self.root.after(0, self._apply_device_status, seq, device_future, ge_future, on_done)
+            except Exception:
+                pass  # Window was closed while probing
+        
+        # Chained so the result is posted exactly once, after both probes finish
+        ge_future.add_done_callback(lambda _: device_future.add_done_callback(post))
+    
+    def _apply_device_status(self, seq, device_future, ge_future, on_done):
+        """Show finished probe results (main thread)"""
+        changed = False
+        try:
+            if seq > self._probe_applied:
+                self._probe_applied = seq
+                changed = self._show_device_status(device_future.result(), ge_future.result())
+        finally:
+            # Keep the monitor and the Refresh button going even if a probe failed
+            if on_done:
+                on_done(changed)
+    
+    def _show_device_status(self, device, garmin_express_running):
+        """Update the device labels; returns False if nothing changed since the last refresh"""
         # Store detected device for model-specific adjustments
         self.current_device = device
+        state = (device and device.get('name'), device and device.get('mode'),
+                 garmin_express_running)
+        
+        # Nothing changed since the last refresh - leave the labels alone
+        if state == self._device_state:
+            return False
+        self._device_state = state
 
         # Remove any existing close button
         if hasattr(self, 'close_ge_btn') and self.close_ge_btn:
@@ -724,7 +1306,7 @@ class GarminUploaderMac:
                     # Add close button in the status container
                     parent_frame = self.device_status_detail.master
                     self.close_ge_btn = Button(parent_frame, text="Close Garmin Express",
-                                              font=('SF Pro Text', 11), bg='#FF9500', fg='white',
+                                              font=self.font_body, bg='#FF9500', fg='white',
                                               command=self.close_garmin_express_clicked, relief=FLAT,
                                               cursor='hand2', padx=10, pady=4)
                     self.close_ge_btn.pack(anchor='w', pady=(8, 0))
@@ -736,25 +1318,39 @@ class GarminUploaderMac:
                 self.device_status_detail.config(text="Connect watch via USB (keep screen awake)")
         except:
             pass  # Widget was destroyed
+        return True
     
     def close_garmin_express_clicked(self):
         """Handle Close Garmin Express button click"""
         self.kill_garmin_express()
         self.device_status.config(text="🔄 Closing Garmin Express...", fg='#666')
+        self._device_state = None  # Force the next refresh to redraw the status
         self.root.after(1500, self.refresh_device_status)
     
     def start_device_monitor(self):
-        """Start background thread to monitor device connection"""
-        def monitor():
-            while self._monitor_running:
-                try:
-                    self.root.after(0, self.refresh_device_status)
-                except:
-                    break
-                time.sleep(3)  # Check every 3 seconds
-        
-        thread = threading.Thread(target=monitor, daemon=True)
-        thread.start()
+        """Poll device connection on the Tk event loop, backing off while nothing changes"""
+        if not self._monitor_running:
+            return
+        # The next poll is scheduled once this probe has finished
+        self._monitor_after_id = None
+        self.refresh_device_status(on_done=self._schedule_device_poll)
+    
+    def _schedule_device_poll(self, changed):
+        """Schedule the next monitor poll after a probe (main thread)"""
+        if not self._monitor_running:
+            return
+        if changed:
+            self._poll_interval = DEVICE_POLL_MS
+        else:
+            self._poll_interval = min(self._poll_interval * 2, DEVICE_POLL_MAX_MS)
+        self._monitor_after_id = self.root.after(self._poll_interval, self.start_device_monitor)
+    
+    def _reset_device_poll(self):
+        """Snap the monitor back to the fast poll interval (e.g. after a manual refresh)"""
+        self._poll_interval = DEVICE_POLL_MS
+        if self._monitor_after_id:
+            self.root.after_cancel(self._monitor_after_id)
+            self._monitor_after_id = self.root.after(self._poll_interval, self.start_device_monitor)
     
     def create_menu(self):
         """Create the application menu bar"""
@@ -771,36 +1367,38 @@ class GarminUploaderMac:
         
         # GOTOES online tools
         tools_menu.add_command(label="🔧 Repair FIT File", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Combine_FIT_Files.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Combine_FIT_Files.php'))
         tools_menu.add_command(label="🔗 Merge FIT/GPX Files", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Combine_GPX_TCX_FIT_Files.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Combine_GPX_TCX_FIT_Files.php'))
         tools_menu.add_command(label="📊 View FIT File Data", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/View_FIT_Data.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/View_FIT_Data.php'))
         tools_menu.add_command(label="🕐 Add Timestamps to GPX", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Add_Timestamps_To_GPX.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Add_Timestamps_To_GPX.php'))
         tools_menu.add_separator()
         tools_menu.add_command(label="📉 Shrink FIT File", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Shrink_FIT_File.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Shrink_FIT_File.php'))
         tools_menu.add_command(label="⏱️ Time-Shift Activity", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Adjust_Activity_Time.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Adjust_Activity_Time.php'))
         tools_menu.add_command(label="🏁 Race Repair (GPS)", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/Race_Repair.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/Race_Repair.php'))
         tools_menu.add_separator()
         tools_menu.add_command(label="🌐 All GOTOES Tools...", 
-                              command=lambda: webbrowser.open('https://gotoes.org/strava/index.php'))
+                              command=partial(open_url, 'https://gotoes.org/strava/index.php'))
         
         # Help menu
         help_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="How to Use", command=self.show_help)
         help_menu.add_command(label="Get OpenMTP",
-                             command=lambda: webbrowser.open('https://openmtp.ganeshrvel.com'))
+                             command=partial(open_url, 'https://openmtp.ganeshrvel.com'))
         help_menu.add_separator()
         help_menu.add_command(label="Check for Updates...", command=self.check_for_updates_manual)
         help_menu.add_command(label="About", command=self.show_about)
     
     def create_ui(self):
         """Create the main interface"""
+        self._step_badge_image = self._make_step_badge_image()
+        
         # Main container
         main = Frame(self.root, bg='#f5f5f7', padx=30, pady=25)
         main.pack(fill=BOTH, expand=True)
@@ -826,7 +1424,7 @@ class GarminUploaderMac:
         help_frame.pack(fill=X, pady=(15, 0))
         
         help_btn = Label(help_frame, text="Need help? Click here", fg='#007AFF', bg='#f5f5f7',
-                        cursor='hand2', font=('SF Pro Text', 11, 'underline'))
+                        cursor='hand2', font=self.font_link)
         help_btn.pack()
         help_btn.bind('<Button-1>', lambda e: self.show_help())
     
@@ -841,20 +1439,32 @@ class GarminUploaderMac:
         header = Frame(card, bg='#fff')
         header.pack(fill=X, pady=(0, 10))
         
-        # Step number circle
-        num_canvas = Canvas(header, width=28, height=28, bg='#fff', highlightthickness=0)
-        num_canvas.pack(side=LEFT, padx=(0, 10))
-        num_canvas.create_oval(2, 2, 26, 26, fill='#007AFF', outline='')
-        num_canvas.create_text(14, 14, text=number, fill='white', font=('SF Pro Display', 13, 'bold'))
+        # Step number circle (shared circle image with the number drawn on top)
+        Label(header, image=self._step_badge_image, text=number, compound=CENTER,
+              font=self.font_step_number, fg='white', bg='#fff',
+              borderwidth=0, padx=0, pady=0).pack(side=LEFT, padx=(0, 10))
         
         # Title
-        Label(header, text=title, font=('SF Pro Text', 13, 'bold'), bg='#fff').pack(side=LEFT)
+        Label(header, text=title, font=self.font_heading, bg='#fff').pack(side=LEFT)
         
         # Content
         content_frame = Frame(card, bg='#fff')
         content_frame.pack(fill=X)
         content_func(content_frame)
     
+    @staticmethod
+    def _make_step_badge_image(size=28, inset=2, color='#007AFF'):
+        """Rasterize the step number circle once into a PhotoImage"""
+        img = PhotoImage(width=size, height=size)
+        center = size / 2
+        radius = center - inset
+        for y in range(size):
+            dy = y + 0.5 - center
+            if abs(dy) < radius:
+                half = (radius * radius - dy * dy) ** 0.5
+                img.put(color, to=(int(center - half + 0.5), y, int(center + half + 0.5), y + 1))
+        return img
+    
     def create_file_selector(self, parent):
         """Step 1: File selection with drag and drop support"""
         # Drop zone frame (for visual feedback)
@@ -862,7 +1472,7 @@ class GarminUploaderMac:
         self.drop_zone.pack(fill=X)
         
         # Listbox (EXTENDED mode for multi-select)
-        self.file_listbox = Listbox(self.drop_zone, height=4, font=('SF Pro Text', 11),
+        self.file_listbox = Listbox(self.drop_zone, height=4, font=self.font_body,
                                      selectmode=EXTENDED,
                                      selectbackground='#007AFF', activestyle='none',
                                      highlightthickness=2, highlightbackground='#e0e0e0',
@@ -888,16 +1498,16 @@ class GarminUploaderMac:
         btn_frame = Frame(parent, bg='#fff')
         btn_frame.pack(fill=X)
         
-        self.add_btn = Button(btn_frame, text="＋ Add Files", font=('SF Pro Text', 11),
+        self.add_btn = Button(btn_frame, text="＋ Add Files", font=self.font_body,
                               command=self.add_files, bg='#007AFF', fg='white',
                               padx=15, pady=5, relief=FLAT, cursor='hand2')
         self.add_btn.pack(side=LEFT)
         
-        self.clear_btn = Button(btn_frame, text="Clear", font=('SF Pro Text', 11),
+        self.clear_btn = Button(btn_frame, text="Clear", font=self.font_body,
                                 command=self.clear_files, padx=10, pady=5, relief=FLAT)
         self.clear_btn.pack(side=LEFT, padx=(8, 0))
         
-        self.preview_btn = Button(btn_frame, text="👁 Preview", font=('SF Pro Text', 11),
+        self.preview_btn = Button(btn_frame, text="👁 Preview", font=self.font_body,
                                   command=self.preview_selected_file, padx=10, pady=5, relief=FLAT)
         self.preview_btn.pack(side=LEFT, padx=(8, 0))
         
@@ -905,12 +1515,12 @@ class GarminUploaderMac:
         count_frame = Frame(parent, bg='#fff')
         count_frame.pack(fill=X, pady=(5, 0))
         
-        self.file_count = Label(count_frame, text="", font=('SF Pro Text', 11), bg='#fff', fg='#666')
+        self.file_count = Label(count_frame, text="", font=self.font_body, bg='#fff', fg='#666')
         self.file_count.pack(side=LEFT)
         
         # Drag and drop status indicator
         if DND_AVAILABLE:
-            self.dnd_status = Label(count_frame, text="📥 Drop enabled", font=('SF Pro Text', 10), 
+            self.dnd_status = Label(count_frame, text="📥 Drop enabled", font=self.font_caption, 
                                     bg='#fff', fg='#34C759')
             self.dnd_status.pack(side=RIGHT)
     
@@ -946,40 +1556,21 @@ class GarminUploaderMac:
     
     def parse_drop_data(self, data):
         """Parse the dropped file data from tkinterdnd2"""
-        files = []
-        
-        # Handle different formats
-        # Format 1: {/path/to/file1} {/path/to/file2}
-        # Format 2: /path/to/file1 /path/to/file2
-        
-        if '{' in data:
-            # Files are wrapped in braces (common on macOS)
-            import re
-            matches = re.findall(r'\{([^}]+)\}', data)
-            files = matches
-        else:
-            # Try to split by spaces, but handle spaces in filenames
-            # This is tricky - assume each path starts with /
-            parts = data.split()
-            current_path = ""
-            for part in parts:
-                if part.startswith('/') and current_path:
-                    files.append(current_path)
-                    current_path = part
-                elif part.startswith('/'):
-                    current_path = part
-                else:
-                    current_path += ' ' + part
-            if current_path:
-                files.append(current_path)
+        # tkinterdnd2 delivers a Tcl list ({/path with spaces} /plain/path),
+        # so let Tcl split it - handles braces and spaces correctly
+        try:
+            paths = self.root.tk.splitlist(data)
+        except TclError:
+            # Malformed Tcl list (e.g. unbalanced brace in a name) - split only where
+            # the next absolute path starts, so names with spaces stay whole
+            paths = [p.strip('{}') for p in re.split(r'\s+(?=\{?/)', data.strip())]
         
         # Filter to only .fit files
-        fit_files = [f for f in files if f.lower().endswith('.fit')]
-        
-        return fit_files
+        return [p for p in paths if is_fit_file(p)]
     
-    def add_files_to_list(self, files):
-        """Add files to the selection list"""
+    def add_files_to_list(self, files, suffix=""):
+        """Add files to the selection list.
+        Callers must pass paths already filtered to .fit (parse_drop_data / add_files)."""
         if not files:
             return
         
@@ -988,20 +1579,53 @@ class GarminUploaderMac:
             self.file_listbox.delete(0, END)
             self.file_listbox.config(fg='black')
         
-        added_count = 0
+        entries = []
         for f in files:
-            if f not in self.selected_files:
-                if f.lower().endswith('.fit'):
-                    self.selected_files.append(f)
-                    name = os.path.basename(f)
-                    self.file_listbox.insert(END, f"  📄 {name}")
-                    added_count += 1
-        
-        if added_count > 0:
-            self.update_ui_state()
-            # Flash success feedback
-            self.file_listbox.config(highlightbackground='#34C759')
-            self.root.after(300, lambda: self.file_listbox.config(highlightbackground='#e0e0e0'))
+            if f in self._selected_set:
+                continue
+            base = os.path.basename(f)
+            self._selected_set.add(f)
+            self.selected_files.append((f, base))
+            entries.append(f"  📄 {base}{suffix}")
+        
+        if not entries:
+            return
+        
+        # Drop the "... more files" row; it's re-added below with the new count
+        if self._listbox_shown < len(self.selected_files) - len(entries):
+            self.file_listbox.delete(self._listbox_shown, END)
+        
+        # Only the first LISTBOX_MAX_VISIBLE files get rows - all are still staged
+        entries = entries[:max(0, LISTBOX_MAX_VISIBLE - self._listbox_shown)]
+        self._listbox_shown += len(entries)
+        
+        extra = len(self.selected_files) - self._listbox_shown
+        if extra > 0:
+            entries.append(f"  … and {extra:,} more files")
+        
+        # One Tcl insert for the whole batch (rows are capped above, so it stays small);
+        # Tk redraws once at idle rather than per row
+        if entries:
+            self.file_listbox.insert(END, *entries)
+        
+        self.update_ui_state()
+        self._flash_success()
+    
+    def _flash_success(self):
+        """Flash success feedback on the listbox (coalesces repeated drops)"""
+        if self._flash_pending:
+            return
+        self._flash_pending = True
+        self.file_listbox.config(highlightbackground='#34C759')
+        self.root.after(300, self._end_flash)
+    
+    def _end_flash(self):
+        """Reset the listbox highlight after a success flash"""
+        self._flash_pending = False
+        try:
+            self.file_listbox.config(highlightbackground='#e0e0e0')
+        except:
+            pass  # Widget was destroyed
     
     def create_prepare_section(self, parent):
         """Step 2: Prepare transfer"""
@@ -1009,19 +1633,12 @@ class GarminUploaderMac:
         instructions = Frame(parent, bg='#fff')
         instructions.pack(fill=X)
         
-        steps_text = """Before transferring, make sure:
-
-✓  Your Garmin watch is connected via USB
-✓  On your watch: Settings → System → USB Mode → MTP
-✓  Accept "Use MTP" prompt on the watch if asked
-✓  Garmin Express is closed (quit it if running)"""
-        
-        Label(instructions, text=steps_text, font=('SF Pro Text', 11), bg='#fff',
+        Label(instructions, text=PREPARE_STEPS, font=self.font_body, bg='#fff',
               justify=LEFT, anchor='w').pack(fill=X)
         
         # Prepare button
         self.prepare_btn = Button(parent, text="✓ Ready - Stage My Files", 
-                                   font=('SF Pro Text', 12, 'bold'),
+                                   font=self.font_large_bold,
                                    command=self.stage_files, bg='#34C759', fg='white',
                                    padx=20, pady=8, relief=FLAT, cursor='hand2',
                                    state=DISABLED)
@@ -1040,11 +1657,11 @@ class GarminUploaderMac:
         header_row = Frame(device_frame, bg='#f0f0f0')
         header_row.pack(fill=X)
         
-        Label(header_row, text="Device Status:", font=('SF Pro Text', 11, 'bold'),
+        Label(header_row, text="Device Status:", font=self.font_body_bold,
               bg='#f0f0f0', fg='#333').pack(side=LEFT)
         
         # Use a proper styled button
-        self.refresh_btn = Button(header_row, text="↻ Refresh", font=('SF Pro Text', 11),
+        self.refresh_btn = Button(header_row, text="↻ Refresh", font=self.font_body,
                             bg='white', fg='#007AFF', relief=SOLID, cursor='hand2',
                             borderwidth=1, padx=12, pady=4, 
                             activebackground='#007AFF', activeforeground='white',
@@ -1057,22 +1674,24 @@ class GarminUploaderMac:
         
         # Main status text
         self.device_status = Label(status_container, text="🔍 Checking for device...",
-                                   font=('SF Pro Text', 13, 'bold'), bg='#f0f0f0', fg='#666',
+                                   font=self.font_heading, bg='#f0f0f0', fg='#666',
                                    anchor='w')
         self.device_status.pack(fill=X)
         
         # Detail/tip text
         self.device_status_detail = Label(status_container, text="Please wait...",
-                                          font=('SF Pro Text', 11), bg='#f0f0f0', fg='#666',
+                                          font=self.font_body, bg='#f0f0f0', fg='#666',
                                           anchor='w')
         self.device_status_detail.pack(fill=X, pady=(2, 0))
         
         # Initial state - waiting
         self.transfer_status = Label(parent, 
             text="Stage your files first (Step 2), then transfer instructions will appear here.",
-            font=('SF Pro Text', 11), bg='#fff', fg='#666', wraplength=480, justify=LEFT)
+            font=self.font_body, bg='#fff', fg='#666', wraplength=480, justify=LEFT)
         self.transfer_status.pack(fill=X, pady=(5, 0))
         
+        self._build_transfer_widgets()
+        
         # Start device monitoring after UI is built
         self.root.after(500, self.refresh_device_status)
         self.root.after(1000, self.start_device_monitor)
@@ -1082,13 +1701,20 @@ class GarminUploaderMac:
         self.refresh_btn.config(text="⏳ Checking...", state=DISABLED)
         self.device_status.config(text="🔍 Checking for device...", fg='#666')
         self.device_status_detail.config(text="Please wait...")
-        self.root.update()
-        
-        # Do the refresh
-        self.refresh_device_status()
         
-        # Reset button
-        self.root.after(500, lambda: self.refresh_btn.config(text="↻ Refresh", state=NORMAL))
+        # Do the refresh (bypass cached probe output and redraw the labels);
+        # the button is reset once the probe has finished
+        self._sp_cache['ts'] = 0.0
+        self._device_state = None
+        self.refresh_device_status(deep=True, on_done=self._refresh_done)
+        self._reset_device_poll()
+    
+    def _refresh_done(self, changed):
+        """Reset the Refresh button after a manual refresh (main thread)"""
+        try:
+            self.refresh_btn.config(text="↻ Refresh", state=NORMAL)
+        except:
+            pass  # Widget was destroyed
     
     def add_files(self):
         """Open file dialog to add .FIT files"""
@@ -1098,11 +1724,13 @@ class GarminUploaderMac:
         )
         
         if files:
-            self.add_files_to_list(list(files))
+            self.add_files_to_list([f for f in files if is_fit_file(f)])
     
     def clear_files(self):
         """Clear all selected files"""
         self.selected_files = []
+        self._selected_set = set()
+        self._listbox_shown = 0
         self.file_listbox.delete(0, END)
         
         if DND_AVAILABLE:
@@ -1114,178 +1742,217 @@ class GarminUploaderMac:
         self.update_ui_state()
     
     def update_ui_state(self):
+        """Schedule a button state update (collapses repeated calls into one idle pass)"""
+        if self._ui_update_scheduled:
+            return
+        self._ui_update_scheduled = True
+        self.root.after_idle(self._apply_ui_state)
+    
+    def _apply_ui_state(self):
         """Update button states based on current state"""
+        self._ui_update_scheduled = False
         count = len(self.selected_files)
         
         if count > 0:
             self.file_count.config(text=f"{count} file{'s' if count > 1 else ''} selected")
-            self.prepare_btn.config(state=NORMAL)
         else:
             self.file_count.config(text="")
-            self.prepare_btn.config(state=DISABLED)
+        
+        # Leave the button alone while staging; _on_stage_complete re-enables it
+        if not self._staging:
+            self.prepare_btn.config(state=NORMAL if count > 0 else DISABLED)
     
     def stage_files(self):
         """Copy files to staging folder and prepare for transfer"""
-        if not self.selected_files:
+        if not self.selected_files or self._staging:
             return
         
-        # Kill Garmin Express
-        self.kill_garmin_express()
-        
-        # Clear staging folder
-        for f in self.staging_folder.glob('*.fit'):
-            f.unlink()
-        for f in self.staging_folder.glob('*.FIT'):
-            f.unlink()
+        # Disable to prevent re-entry while the worker runs
+        self._staging = True
+        self.prepare_btn.config(text="⏳ Staging...", state=DISABLED)
         
-        # Copy files
+        selected = list(self.selected_files)
+        threading.Thread(target=self._stage_worker, args=(selected,), daemon=True).start()
+    
+    def _stage_worker(self, selected):
+        """Stage files in background thread"""
         staged = []
-        for filepath in self.selected_files:
-            try:
-                filename = os.path.basename(filepath)
-                dest = self.staging_folder / filename
-                shutil.copy2(filepath, dest)
-                staged.append(filename)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to copy {filename}: {e}")
+        errors = []
+        stale = []  # previously staged files that couldn't be removed
+        try:
+            # Kill Garmin Express
+            self.kill_garmin_express()
+            
+            # Recreate the staging folder if it was removed since launch
+            self.staging_folder.mkdir(parents=True, exist_ok=True)
+            
+            # Clear staging folder (single pass, any .fit/.FIT casing)
+            with os.scandir(self.staging_folder) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False) and is_fit_file(entry.name):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError as e:
+                            stale.append(f"{entry.name}: {e}")
+            
+            # One source per staged name (case-insensitive, like APFS) - parallel copies
+            # of two same-named files would race on the same destination
+            unique = {}
+            for src, base in selected:
+                first = unique.setdefault(base.casefold(), (src, base))
+                if first[0] != src:
+                    errors.append(f"{base}: same name as {first[0]}, not staged ({src})")
+            
+            # Copy files in parallel - file I/O releases the GIL so copies overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(unique))) as executor:
+                futures = [executor.submit(_copy_one, src, self.staging_folder / base, base)
+                           for src, base in unique.values()]
+                for future in as_completed(futures):
+                    filename, err = future.result()
+                    if err:
+                        errors.append(f"{filename}: {err}")
+                    else:
+                        staged.append(filename)
+                        self.root.after(0, self._on_staged, len(staged), len(unique))
+        except Exception as e:
+            # e.g. the staging folder can't be created or read - still finish below
+            errors.append(str(e))
+        
+        self.root.after(0, self._on_stage_complete, staged, errors, stale)
+    
+    def _on_staged(self, done, total):
+        """Update staging progress (main thread)"""
+        try:
+            self.prepare_btn.config(text=f"⏳ Staging {done}/{total}...")
+        except:
+            pass  # Widget was destroyed
+    
+    def _on_stage_complete(self, staged, errors, stale):
+        """Finish staging once the worker is done (main thread)"""
+        self._staging = False
+        sections = []
+        if errors:
+            sections.append("Failed to stage:\n" + "\n".join(errors))
+        if stale:
+            sections.append("Could not remove previously staged files:\n" + "\n".join(stale))
+        if sections:
+            messagebox.showerror("Error", "\n\n".join(sections))
         
         if not staged:
+            self.prepare_btn.config(text="✓ Ready - Stage My Files", state=NORMAL)
             return
         
         # Update Step 3 with transfer instructions (keep device status)
         self.show_transfer_instructions(staged)
         
         # Open staging folder and OpenMTP
-        subprocess.run(['open', str(self.staging_folder)])
+        launch_detached(['open', str(self.staging_folder)])
         self.open_openmtp()
         
         # Show success
         self.prepare_btn.config(text="✓ Files Staged!", bg='#666', state=DISABLED)
     
     
+    def _build_transfer_widgets(self):
+        """Build the Step 3 helper buttons and OpenMTP warning once (packed on first stage)"""
+        self.transfer_btns_frame = Frame(self.transfer_frame, bg='#fff')
+        
+        Button(self.transfer_btns_frame, text="📂 Open Folder", font=self.font_body,
+               command=lambda: launch_detached(['open', str(self.staging_folder)]),
+               padx=10, pady=5, relief=FLAT, cursor='hand2').pack(side=LEFT)
+        
+        Button(self.transfer_btns_frame, text="🔄 OpenMTP", font=self.font_body,
+               command=self.open_openmtp, padx=10, pady=5, relief=FLAT, cursor='hand2').pack(side=LEFT, padx=(8, 0))
+        
+        self.openmtp_warning_frame = Frame(self.transfer_frame, bg='#fff3e0', padx=10, pady=8)
+        
+        Label(self.openmtp_warning_frame, text="⚠️ OpenMTP not found!", 
+              font=self.font_body_bold, bg='#fff3e0', fg='#e65100').pack()
+        
+        Label(self.openmtp_warning_frame, text="Download it free from: openmtp.ganeshrvel.com", 
+              font=self.font_body, bg='#fff3e0').pack()
+        
+        Button(self.openmtp_warning_frame, text="Download OpenMTP", font=self.font_body,
+               command=partial(open_url, 'https://openmtp.ganeshrvel.com'),
+               bg='#ff9800', fg='white', padx=10, pady=5, relief=FLAT,
+               cursor='hand2').pack(pady=(5, 0))
+    
     def show_transfer_instructions(self, staged_files):
         """Show transfer instructions in Step 3 while keeping device status"""
-        # Only clear transfer_status label, not device status
+        # Only update transfer_status label, not device status
         if hasattr(self, 'transfer_status'):
             self.transfer_status.config(
                 text=f"✓ {len(staged_files)} file(s) ready! Drag from Finder → OpenMTP (GARMIN/NewFiles)",
                 fg='#2e7d32'
             )
         
-        # Clean up existing buttons frame
-        if hasattr(self, 'transfer_btns_frame') and self.transfer_btns_frame:
-            try:
-                self.transfer_btns_frame.destroy()
-            except:
-                pass
-        
-        # Clean up existing warning frame
-        if hasattr(self, 'openmtp_warning_frame') and self.openmtp_warning_frame:
-            try:
-                self.openmtp_warning_frame.destroy()
-            except:
-                pass
-        
-        # Add helper buttons below transfer_status
-        self.transfer_btns_frame = Frame(self.transfer_frame, bg='#fff')
-        self.transfer_btns_frame.pack(fill=X, pady=(8, 0))
+        # Show helper buttons below transfer_status (widgets are reused across stages)
+        if not self.transfer_btns_frame.winfo_manager():
+            self.transfer_btns_frame.pack(fill=X, pady=(8, 0))
         
-        Button(self.transfer_btns_frame, text="📂 Open Folder", font=('SF Pro Text', 11),
-               command=lambda: subprocess.run(['open', str(self.staging_folder)]),
-               padx=10, pady=5, relief=FLAT, cursor='hand2').pack(side=LEFT)
-        
-        Button(self.transfer_btns_frame, text="🔄 OpenMTP", font=('SF Pro Text', 11),
-               command=self.open_openmtp, padx=10, pady=5, relief=FLAT, cursor='hand2').pack(side=LEFT, padx=(8, 0))
-        
-        # If OpenMTP not installed
+        # Only toggle the warning if OpenMTP not installed
         if not self.openmtp_installed:
-            self.openmtp_warning_frame = Frame(self.transfer_frame, bg='#fff3e0', padx=10, pady=8)
-            self.openmtp_warning_frame.pack(fill=X, pady=(10, 0))
-            
-            Label(self.openmtp_warning_frame, text="⚠️ OpenMTP not found!", 
-                  font=('SF Pro Text', 11, 'bold'), bg='#fff3e0', fg='#e65100').pack()
-            
-            Label(self.openmtp_warning_frame, text="Download it free from: openmtp.ganeshrvel.com", 
-                  font=('SF Pro Text', 11), bg='#fff3e0').pack()
-            
-            Button(self.openmtp_warning_frame, text="Download OpenMTP", font=('SF Pro Text', 11),
-                   command=lambda: webbrowser.open('https://openmtp.ganeshrvel.com'),
-                   bg='#ff9800', fg='white', padx=10, pady=5, relief=FLAT,
-                   cursor='hand2').pack(pady=(5, 0))
+            self.openmtp_warning_frame.pack(fill=X, pady=(10, 0), after=self.transfer_btns_frame)
+        else:
+            self.openmtp_warning_frame.pack_forget()
     
     def open_openmtp(self):
         """Open OpenMTP application"""
-        paths = [
-            "/Applications/OpenMTP.app",
-            str(self.home / "Applications/OpenMTP.app")
-        ]
-        
-        for path in paths:
-            if os.path.exists(path):
-                subprocess.run(['open', path])
-                return True
+        # One stat on the cached path; re-scan the candidates only if it's gone
+        # (or was never found - the user may have installed it meanwhile)
+        if (self._openmtp_path and os.path.exists(self._openmtp_path)) or self.check_openmtp():
+            launch_detached(['open', self._openmtp_path])
+            return True
         
         # Try Android File Transfer as fallback
-        aft = "/Applications/Android File Transfer.app"
-        if os.path.exists(aft):
-            subprocess.run(['open', aft])
+        if os.path.exists(ANDROID_FILE_TRANSFER_APP):
+            launch_detached(['open', ANDROID_FILE_TRANSFER_APP])
             return True
         
         return False
     
     def show_help(self):
-        """Show help dialog"""
+        """Show help dialog (built once, then shown/hidden)"""
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+        
         help_window = Toplevel(self.root)
+        self._help_window = help_window
         help_window.title("Help")
         help_window.geometry("500x450")
         help_window.configure(bg='#f5f5f7')
         help_window.transient(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
         
         frame = Frame(help_window, bg='#f5f5f7', padx=25, pady=20)
         frame.pack(fill=BOTH, expand=True)
         
-        Label(frame, text="Help & Troubleshooting", font=('SF Pro Display', 18, 'bold'),
+        Label(frame, text="Help & Troubleshooting", font=self.font_title,
               bg='#f5f5f7').pack(pady=(0, 15))
         
-        help_text = """Why do I need OpenMTP?
-Mac doesn't support MTP (the protocol Garmin uses).
-OpenMTP bridges this gap - it's free and works great.
-
-Watch not showing in OpenMTP?
-• Make sure USB cable supports data (not charge-only)
-• On watch: Settings → System → USB Mode → MTP
-• Quit Garmin Express completely
-• Unplug and replug the watch
-• Click "Refresh" in OpenMTP
-
-Can't find NewFiles folder?
-Look for: GARMIN → NewFiles
-If only "Workouts" exists, use that instead.
-
-Workouts not appearing on watch?
-• Restart your watch after transfer
-• Check: Training → Workouts
-• Make sure files are valid .FIT workout files
-
-Where do workouts come from?
-• Create in Garmin Connect (web or app)
-• Export from TrainingPeaks, Intervals.icu, etc.
-• Download from training plan providers
-
-My files are stuck in GarminWorkouts folder?
-That's just the staging folder on your Mac.
-You still need to drag them to OpenMTP."""
-        
-        Label(frame, text=help_text, font=('SF Pro Text', 11), bg='#f5f5f7',
-              justify=LEFT, anchor='w').pack(fill=X)
-        
-        Button(frame, text="Get OpenMTP", font=('SF Pro Text', 11),
-               command=lambda: webbrowser.open('https://openmtp.ganeshrvel.com'),
+        # Read-only Text filled with one tagged insert - the first line of each
+        # section (the question) is bold
+        help_text = Text(frame, font=self.font_body, bg='#f5f5f7', wrap=WORD,
+                         height=HELP_TEXT.count('\n') + 1, relief=FLAT, borderwidth=0,
+                         highlightthickness=0, cursor='arrow')
+        help_text.tag_configure('heading', font=self.font_body_bold)
+        chunks = []
+        for section in HELP_TEXT.split('\n\n'):
+            heading, _, body = section.partition('\n')
+            chunks += [heading + '\n', 'heading', body + '\n\n', ()]
+        help_text.insert(END, *chunks)
+        help_text.config(state=DISABLED)
+        help_text.pack(fill=X)
+        
+        Button(frame, text="Get OpenMTP", font=self.font_body,
+               command=partial(open_url, 'https://openmtp.ganeshrvel.com'),
                bg='#007AFF', fg='white', padx=15, pady=8, relief=FLAT,
                cursor='hand2').pack(pady=(15, 10))
         
-        Button(frame, text="Close", command=help_window.destroy,
-               font=('SF Pro Text', 11), padx=15, pady=5, relief=FLAT).pack()
+        Button(frame, text="Close", command=help_window.withdraw,
+               font=self.font_body, padx=15, pady=5, relief=FLAT).pack()
     
     def show_about(self):
         """Show about dialog"""
@@ -1312,7 +1979,7 @@ You still need to drag them to OpenMTP."""
         if not selection:
             # If nothing selected but files exist, preview all
             if self.selected_files:
-                filepaths = self.selected_files
+                filepaths = [f for f, _ in self.selected_files]
             else:
                 messagebox.showinfo("Preview", "Please select a .FIT file first")
                 return
@@ -1320,8 +1987,12 @@ You still need to drag them to OpenMTP."""
             # Get all selected files
             filepaths = []
             for idx in selection:
-                if idx < len(self.selected_files):
-                    filepaths.append(self.selected_files[idx])
+                if idx < self._listbox_shown:  # Skip the "... more files" row
+                    filepaths.append(self.selected_files[idx][0])
+            if not filepaths:
+                # Only the overflow or placeholder row was selected
+                messagebox.showinfo("Preview", "Please select a .FIT file first")
+                return
         
         if len(filepaths) == 1:
             self.show_fit_preview(filepaths[0])
@@ -1331,14 +2002,14 @@ You still need to drag them to OpenMTP."""
     def show_fit_preview(self, filepath):
         """Show FIT file preview matching AmakaFlow app style"""
         # Parse the FIT file
-        workout_data = self.parse_fit_file(filepath)
+        workout_data = self._get_workout(filepath)
 
         if not workout_data:
             messagebox.showerror("Error", "Could not parse FIT file. It may be corrupted or not a workout file.")
             return
 
         # Validate the FIT file for issues
-        validation = self.validate_fit_file(filepath)
+        validation = self.validate_fit_file(filepath, workout_data)
 
         # Create preview window
         preview = Toplevel(self.root)
@@ -1347,15 +2018,6 @@ You still need to drag them to OpenMTP."""
         preview.configure(bg='#1a1a1a')
         preview.transient(self.root)
 
-        # Unbind mousewheel on close
-        def on_close():
-            try:
-                preview.unbind_all("<MouseWheel>")
-            except:
-                pass
-            preview.destroy()
-        preview.protocol("WM_DELETE_WINDOW", on_close)
-
         # Main container with dark theme
         main = Frame(preview, bg='#1a1a1a', padx=20, pady=20)
         main.pack(fill=BOTH, expand=True)
@@ -1366,10 +2028,10 @@ You still need to drag them to OpenMTP."""
             warning_frame.pack(fill=X, pady=(0, 10))
 
             Label(warning_frame, text="⚠️ Compatibility Issue Detected",
-                  font=('SF Pro Text', 11, 'bold'), bg='#dc3545', fg='#fff').pack(anchor='w')
+                  font=self.font_body_bold, bg='#dc3545', fg='#fff').pack(anchor='w')
 
             for issue in validation['issues'][:2]:  # Show first 2 issues
-                Label(warning_frame, text=issue, font=('SF Pro Text', 9),
+                Label(warning_frame, text=issue, font=self.font_small,
                       bg='#dc3545', fg='#fff', wraplength=400, justify=LEFT).pack(anchor='w')
 
             # Repair button if fitfiletool is available
@@ -1381,14 +2043,11 @@ You still need to drag them to OpenMTP."""
                             f"Workout repaired and saved to:\n{os.path.basename(new_file)}\n\n"
                             "The repaired file uses valid exercise categories that work on all Garmin watches.")
                         # Add repaired file to selection
-                        if new_file not in self.selected_files:
-                            self.selected_files.append(new_file)
-                            self.file_listbox.insert(END, f"  📄 {os.path.basename(new_file)} (repaired)")
-                            self.file_count.config(text=f"{len(self.selected_files)} file(s) selected")
+                        self.add_files_to_list([new_file], suffix=" (repaired)")
                     else:
                         messagebox.showerror("Error", f"Could not repair file:\n{error}")
 
-                Button(warning_frame, text="🔧 Repair Workout", font=('SF Pro Text', 10, 'bold'),
+                Button(warning_frame, text="🔧 Repair Workout", font=self.font_caption_bold,
                        command=do_repair, bg='#fff', fg='#dc3545',
                        padx=12, pady=4, relief=FLAT, cursor='hand2').pack(anchor='w', pady=(5, 0))
 
@@ -1399,7 +2058,7 @@ You still need to drag them to OpenMTP."""
 
         # Workout title
         title = workout_data.get('name', 'Workout')
-        Label(watch_frame, text=title, font=('SF Pro Display', 14, 'bold'),
+        Label(watch_frame, text=title, font=self.font_watch_title,
               bg='#000', fg='#fff', wraplength=380).pack(pady=(5, 5))
 
         # Sport type badge
@@ -1410,7 +2069,7 @@ You still need to drag them to OpenMTP."""
             sport_color = get_sport_color(sport, sub_sport)
 
             sport_badge = Label(watch_frame, text=f"  {sport_display}  ",
-                               font=('SF Pro Text', 10, 'bold'),
+                               font=self.font_caption_bold,
                                bg=sport_color, fg='#fff')
             sport_badge.pack(pady=(0, 5))
 
@@ -1418,21 +2077,10 @@ You still need to drag them to OpenMTP."""
         meta_frame = Frame(watch_frame, bg='#000')
         meta_frame.pack(fill=X, pady=(0, 10))
 
-        meta_parts = []
-        if workout_data.get('source'):
-            meta_parts.append(f"📱 {workout_data['source']}")
-        if workout_data.get('created'):
-            # Format date nicely
-            created = workout_data['created'].split(' ')[0] if ' ' in workout_data['created'] else workout_data['created']
-            meta_parts.append(f"📅 {created}")
-
-        # Calculate total duration
-        total_duration = sum(ex.get('duration', 0) for ex in workout_data.get('steps', []))
-        if total_duration > 0:
-            meta_parts.append(f"⏱ {self.format_duration(total_duration)}")
-
-        if meta_parts:
-            Label(meta_frame, text="  •  ".join(meta_parts), font=('SF Pro Text', 9),
+        exercises = workout_data.get('steps', [])
+        meta_text = self._workout_meta_text(workout_data)
+        if meta_text:
+            Label(meta_frame, text=meta_text, font=self.font_small,
                   bg='#000', fg='#666').pack()
 
         # Scrollable exercise list
@@ -1447,23 +2095,15 @@ You still need to drag them to OpenMTP."""
         canvas_window = canvas.create_window((0, 0), window=exercise_frame, anchor='nw')
 
         # Bind canvas resize
-        def configure_canvas(event):
-            canvas.configure(scrollregion=canvas.bbox('all'))
-            canvas.itemconfig(canvas_window, width=event.width)
+        self._track_scroll_region(canvas, canvas_window, exercise_frame)
 
-        exercise_frame.bind('<Configure>', configure_canvas)
-        canvas.bind('<Configure>', lambda e: canvas.itemconfig(canvas_window, width=e.width))
-
-        # Mouse wheel scrolling - scoped to this canvas
+        # Mouse wheel scrolling - bound once on the window, which is in every
+        # row's bindtags, so the wheel works over the rows too
         def on_mousewheel(event):
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        preview.bind("<MouseWheel>", on_mousewheel)
 
         # Process steps to detect repeat structures
-        exercises = workout_data.get('steps', [])
         processed_steps = self.process_steps_for_preview(exercises)
 
         # Stats counters
@@ -1472,30 +2112,33 @@ You still need to drag them to OpenMTP."""
         total_sets = 0
         repeat_count = 0
 
-        # Display processed steps
+        # Collect a builder per processed step (rows are created in slices below)
+        rows = []
         for step_info in processed_steps:
             step_type = step_info.get('display_type', 'exercise')
 
             if step_type == 'repeat_header':
-                self.create_repeat_header(exercise_frame, step_info)
+                rows.append(partial(self.create_repeat_header, exercise_frame, step_info))
                 repeat_count += 1
                 total_sets += step_info.get('repeat_count', 1)
             elif step_type == 'nested_exercise':
-                self.create_nested_exercise_row(exercise_frame, step_info)
+                rows.append(partial(self.create_nested_exercise_row, exercise_frame, step_info))
                 exercise_count += 1
             elif step_type == 'nested_rest':
-                self.create_nested_rest_row(exercise_frame, step_info)
+                rows.append(partial(self.create_nested_rest_row, exercise_frame, step_info))
                 rest_count += 1
             elif step_info.get('is_rest') or step_info.get('step_type') == 'rest':
-                self.create_rest_row(exercise_frame, step_info)
+                rows.append(partial(self.create_rest_row, exercise_frame, step_info))
                 rest_count += 1
             elif step_info.get('step_type') == 'warmup':
-                self.create_warmup_row(exercise_frame, step_info)
+                rows.append(partial(self.create_warmup_row, exercise_frame, step_info))
                 exercise_count += 1
             else:
-                self.create_exercise_row(exercise_frame, step_info, exercise_count, sport)
+                rows.append(partial(self.create_exercise_row, exercise_frame, step_info,
+                                    exercise_count, sport))
                 exercise_count += 1
                 total_sets += step_info.get('sets', 1)
+        self._build_rows_in_slices(exercise_frame, rows)
 
         # Footer stats
         footer = Frame(watch_frame, bg='#000')
@@ -1508,7 +2151,7 @@ You still need to drag them to OpenMTP."""
         if total_sets > exercise_count:
             stats_parts.append(f"{total_sets} total sets")
 
-        Label(footer, text=" • ".join(stats_parts), font=('SF Pro Text', 11),
+        Label(footer, text=" • ".join(stats_parts), font=self.font_body,
               bg='#000', fg='#666').pack()
 
         # Legend matching app style with icons
@@ -1519,17 +2162,29 @@ You still need to drag them to OpenMTP."""
         legend_items.pack(fill=X)
 
         # App-style legend with icons
-        self.create_legend_item(legend_items, "⊙", "Warmup", "#eab308")
-        self.create_legend_item(legend_items, "※", "Warm-Up Set", "#f97316")
-        self.create_legend_item(legend_items, "※", "Exercise", "#fff")
-        self.create_legend_item(legend_items, "↷", "Rest", "#9ca3af")
-        self.create_legend_item(legend_items, "↻", "Repeat", "#3b82f6")
+        for icon, text, color in PREVIEW_LEGEND:
+            self.create_legend_item(legend_items, icon, text, color)
 
         # Close button
-        Button(main, text="Close", font=('SF Pro Text', 12),
-               command=on_close, bg='#333', fg='#fff',
+        Button(main, text="Close", font=self.font_large,
+               command=preview.destroy, bg='#333', fg='#fff',
                padx=20, pady=8, relief=FLAT, cursor='hand2').pack(pady=(10, 0))
 
+    def _workout_meta_text(self, workout_data):
+        """Build the "source • date • duration" line shown under a workout title"""
+        meta_parts = []
+        source = workout_data.get('source')
+        if source:
+            meta_parts.append(f"📱 {source}")
+        created = workout_data.get('created')
+        if created:
+            # Date only, drop the time
+            meta_parts.append(f"📅 {created.split(' ')[0]}")
+        total_duration = workout_data['total_duration']
+        if total_duration > 0:
+            meta_parts.append(f"⏱ {self.format_duration(total_duration)}")
+        return "  •  ".join(meta_parts)
+
     def process_steps_for_preview(self, steps):
         """Process flat steps list to detect repeat structures for hierarchical display.
 
@@ -1645,7 +2300,7 @@ You still need to drag them to OpenMTP."""
         row.pack(fill=X, pady=(8, 2), padx=2)
 
         Label(row, text=f"↻  {step_info.get('text', 'Sets')}",
-              font=('SF Pro Text', 12, 'bold'),
+              font=self.font_large_bold,
               bg='#166534', fg='#4ade80').pack(anchor='w')  # Green text like web #4ade80
 
     def create_nested_exercise_row(self, parent, exercise):
@@ -1671,37 +2326,27 @@ You still need to drag them to OpenMTP."""
         text_color = '#fbbf24' if is_warmup_set else '#93c5fd'  # Matching web colors
         suffix = " (Warm-Up)" if is_warmup_set else ""
 
-        Label(content, text=f"※  {name}{suffix}", font=('SF Pro Text', 11, 'bold'),
+        Label(content, text=f"※  {name}{suffix}", font=self.font_body_bold,
               bg=bg_color, fg=text_color, anchor='w', wraplength=420).pack(fill=X)
 
         # Badges row
-        badges = Frame(content, bg=bg_color)
-        badges.pack(fill=X, pady=(4, 0))
+        badges = []
 
         # Reps badge (green for reps)
         if exercise.get('reps'):
-            self.create_badge(badges, f"{exercise['reps']} reps", "#22c55e")
+            badges.append((f"{exercise['reps']} reps", "#22c55e"))
 
         # Duration badge (blue)
         if exercise.get('duration'):
             duration_str = self.format_duration(exercise['duration'])
-            self.create_badge(badges, duration_str, "#3b82f6")
+            badges.append((duration_str, "#3b82f6"))
         elif exercise.get('duration_type') == 'open':
-            self.create_badge(badges, "Lap Button", "#6b7280")
+            badges.append(("Lap Button", "#6b7280"))
 
         # Category badge (gray)
-        category = exercise.get('category', '')
-        if category:
-            try:
-                cat_id = int(category)
-                cat_name = EXERCISE_CATEGORY_NAMES.get(cat_id, '')
-                if cat_name and cat_name.lower() not in name.lower():
-                    Label(badges, text=cat_name, font=('SF Pro Text', 9),
-                          bg='#374151', fg='#d1d5db', padx=6, pady=2).pack(side=LEFT, padx=(0, 5))
-            except (ValueError, TypeError):
-                if category.lower() not in name.lower():
-                    Label(badges, text=category.replace('_', ' ').title(), font=('SF Pro Text', 9),
-                          bg='#374151', fg='#d1d5db', padx=6, pady=2).pack(side=LEFT, padx=(0, 5))
+        category = self._category_badge_text(exercise.get('category', ''), name)
+
+        self.create_badge_strip(content, badges, bg_color, category)
 
     def create_nested_rest_row(self, parent, rest_info):
         """Create a rest row nested within a repeat block"""
@@ -1717,7 +2362,7 @@ You still need to drag them to OpenMTP."""
         content.pack(side=LEFT, fill=BOTH, expand=True)
 
         # Rest label with icon
-        Label(content, text="↷  Rest", font=('SF Pro Text', 11),
+        Label(content, text="↷  Rest", font=self.font_body,
               bg='#111', fg='#9ca3af', anchor='w').pack(side=LEFT)
 
         # Duration badge
@@ -1735,7 +2380,7 @@ You still need to drag them to OpenMTP."""
         row.pack(fill=X, pady=2, padx=2)
 
         # Rest label with icon
-        Label(row, text="↷  Rest", font=('SF Pro Text', 11, 'bold'),
+        Label(row, text="↷  Rest", font=self.font_body_bold,
               bg='#1f2937', fg='#9ca3af', anchor='w').pack(side=LEFT)
 
         # Duration badge
@@ -1759,21 +2404,18 @@ You still need to drag them to OpenMTP."""
 
         # Warmup label with timer icon (yellow/gold)
         name = warmup_info.get('name', 'Warmup')
-        Label(content, text=f"⊙  {name}", font=('SF Pro Text', 11, 'bold'),
+        Label(content, text=f"⊙  {name}", font=self.font_body_bold,
               bg='#1c1917', fg='#eab308', anchor='w', wraplength=420).pack(fill=X)
 
         # Duration badge
-        badges = Frame(content, bg='#1c1917')
-        badges.pack(fill=X, pady=(4, 0))
-
         duration = warmup_info.get('duration', 0)
         duration_type = warmup_info.get('duration_type', '')
 
         if duration > 0:
             duration_str = self.format_duration(duration)
-            self.create_badge(badges, duration_str, "#3b82f6")
+            self.create_badge_strip(content, [(duration_str, "#3b82f6")], '#1c1917')
         elif duration_type in ('open', 5):  # 5 is FIT SDK OPEN
-            self.create_badge(badges, "Press Lap", "#6b7280")
+            self.create_badge_strip(content, [("Press Lap", "#6b7280")], '#1c1917')
     
     def show_fit_preview_multi(self, filepaths):
         """Show multiple FIT files in a list summary view with single window navigation"""
@@ -1792,15 +2434,6 @@ You still need to drag them to OpenMTP."""
         self._preview_content = Frame(preview, bg='#1a1a1a')
         self._preview_content.pack(fill=BOTH, expand=True)
         
-        # Unbind mousewheel on close
-        def on_close():
-            try:
-                preview.unbind_all("<MouseWheel>")
-            except:
-                pass
-            preview.destroy()
-        preview.protocol("WM_DELETE_WINDOW", on_close)
-        
         # Build the list view
         self._build_list_view()
     
@@ -1816,107 +2449,147 @@ You still need to drag them to OpenMTP."""
         
         preview.title(f"Workout Preview - {len(filepaths)} files")
         
+        # The Treeview scrolls itself - drop the detail view's window-level wheel handler
+        preview.unbind("<MouseWheel>")
+        
         # Header
         header = Frame(content, bg='#1a1a1a')
         header.pack(fill=X, padx=15, pady=(15, 10))
-        Label(header, text=f"📋 {len(filepaths)} Workouts", font=('SF Pro Display', 18, 'bold'),
+        Label(header, text=f"📋 {len(filepaths)} Workouts", font=self.font_title,
               bg='#1a1a1a', fg='#fff').pack(anchor='w')
+        Label(header, text="Double-click a workout to see its steps", font=self.font_caption,
+              bg='#1a1a1a', fg='#888').pack(anchor='w')
         
-        # Scrollable list
-        canvas = Canvas(content, bg='#1a1a1a', highlightthickness=0)
-        scrollbar = Scrollbar(content, orient=VERTICAL, command=canvas.yview)
-        list_frame = Frame(canvas, bg='#1a1a1a')
+        # One Treeview row per workout - a single widget instead of a Frame/Label card each
+        list_frame = Frame(content, bg='#1a1a1a')
+        list_frame.pack(fill=BOTH, expand=True, padx=15)
         
-        canvas.configure(yscrollcommand=scrollbar.set)
+        tree = ttk.Treeview(list_frame, columns=('sport', 'steps', 'duration', 'date'),
+                            show='tree headings', selectmode=BROWSE, style='Workouts.Treeview')
+        scrollbar = Scrollbar(list_frame, orient=VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=RIGHT, fill=Y)
-        canvas.pack(side=LEFT, fill=BOTH, expand=True, padx=(15, 0))
-        
-        canvas_window = canvas.create_window((0, 0), window=list_frame, anchor='nw')
-        
-        def configure_canvas(event):
-            canvas.configure(scrollregion=canvas.bbox('all'))
-            canvas.itemconfig(canvas_window, width=event.width)
-        
-        list_frame.bind('<Configure>', configure_canvas)
-        canvas.bind('<Configure>', lambda e: canvas.itemconfig(canvas_window, width=e.width))
-        
-        # Mouse wheel scrolling - scoped to this canvas
-        def on_mousewheel(event):
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
-
-        # Parse and display each file as a summary row
+        tree.pack(side=LEFT, fill=BOTH, expand=True)
+        
+        tree.heading('#0', text='Workout', anchor='w')
+        tree.column('#0', width=170, anchor='w')
+        for column, heading, width in (('sport', 'Sport', 100), ('steps', 'Steps', 80),
+                                       ('duration', 'Duration', 70), ('date', 'Created', 85)):
+            tree.heading(column, text=heading, anchor='w')
+            tree.column(column, width=width, anchor='w', stretch=False)
+
+        # Files already parsed (e.g. coming Back from a detail view) get their full row
+        # from the cache. The rest are shown straight away from their header messages
+        # (name, sport, date) and filled in as a worker thread parses them
+        pending = []
         for filepath in filepaths:
-            workout_data = self.parse_fit_file(filepath)
-            if not workout_data:
-                continue
-
-            # Card for each workout
-            card = Frame(list_frame, bg='#222', highlightbackground='#333', highlightthickness=1)
-            card.pack(fill=X, pady=4, padx=(0, 15))
-
-            card_content = Frame(card, bg='#222', padx=12, pady=10)
-            card_content.pack(fill=X)
-
-            # Top row: name + sport badge
-            top_row = Frame(card_content, bg='#222')
-            top_row.pack(fill=X)
-
-            name = workout_data.get('name', os.path.basename(filepath))
-            Label(top_row, text=name, font=('SF Pro Text', 13, 'bold'),
-                  bg='#222', fg='#fff').pack(side=LEFT)
-
-            sport = workout_data.get('sport')
-            sub_sport = workout_data.get('sub_sport')
-            if sport:
-                sport_display = get_sport_display(sport, sub_sport)
-                sport_color = get_sport_color(sport, sub_sport)
-                Label(top_row, text=f" {sport_display} ", font=('SF Pro Text', 9, 'bold'),
-                      bg=sport_color, fg='#fff').pack(side=RIGHT)
-            
-            # Stats row
-            stats_row = Frame(card_content, bg='#222')
-            stats_row.pack(fill=X, pady=(6, 0))
-            
-            stats = []
-            exercises = workout_data.get('steps', [])
-            stats.append(f"{len(exercises)} steps")
-            
-            total_duration = sum(ex.get('duration', 0) for ex in exercises)
-            if total_duration > 0:
-                stats.append(f"⏱ {self.format_duration(total_duration)}")
-            
-            total_sets = sum(ex.get('sets', 1) for ex in exercises)
-            if total_sets > len(exercises):
-                stats.append(f"{total_sets} sets")
-            
-            if workout_data.get('created'):
-                created = workout_data['created'].split(' ')[0]
-                stats.append(f"📅 {created}")
-            
-            Label(stats_row, text="  •  ".join(stats), font=('SF Pro Text', 10),
-                  bg='#222', fg='#888').pack(side=LEFT)
-            
-            # Preview button - navigate within same window
-            btn = Label(stats_row, text="👁", font=('SF Pro Text', 14), 
-                       bg='#222', fg='#007AFF', cursor='hand2')
-            btn.pack(side=RIGHT)
-            btn.bind('<Button-1>', lambda e, fp=filepath: self._show_detail_view(fp))
+            if self._workout_is_cached(filepath):
+                workout_data = self._get_workout(filepath)
+                if workout_data:
+                    tree.insert('', END, iid=filepath, **self._workout_row(tree, filepath, workout_data))
+            else:
+                workout_data = self.parse_fit_metadata(filepath) or {}
+                tree.insert('', END, iid=filepath, **self._workout_row(tree, filepath, workout_data))
+                pending.append(filepath)
+        if pending:
+            threading.Thread(target=self._list_parse_worker, args=(tree, pending), daemon=True).start()
+        
+        # Double-click or Return opens the detail view in the same window
+        def open_selected(event=None):
+            filepath = tree.focus()
+            if filepath:
+                self._show_detail_view(filepath)
+        tree.bind('<Double-1>', open_selected)
+        tree.bind('<Return>', open_selected)
         
         # Bottom bar
         bottom = Frame(content, bg='#1a1a1a')
         bottom.pack(fill=X, padx=15, pady=15)
         
-        Button(bottom, text="Close", font=('SF Pro Text', 12),
+        Button(bottom, text="Close", font=self.font_large,
                command=self._preview_window.destroy, bg='#333', fg='#fff',
                padx=20, pady=8, relief=FLAT, cursor='hand2').pack(side=RIGHT)
     
+    def _workout_row(self, tree, filepath, workout_data):
+        """Treeview item options (text, values, tags) summarizing a workout"""
+        name = workout_data.get('name', os.path.basename(filepath))
+
+        # Sport text is tinted with the sport color via a per-sport tag
+        sport = workout_data.get('sport')
+        sub_sport = workout_data.get('sub_sport')
+        sport_display = ''
+        tags = ()
+        if sport:
+            sport_display = get_sport_display(sport, sub_sport)
+            tag = f"{sport}/{sub_sport}"
+            tree.tag_configure(tag, foreground=get_sport_color(sport, sub_sport))
+            tags = (tag,)
+        
+        # Header-only data (still parsing) has no steps or totals yet
+        steps = duration = ''
+        if 'total_sets' in workout_data:
+            exercises = workout_data.get('steps', [])
+            steps = f"{len(exercises)}"
+            total_sets = workout_data['total_sets']
+            if total_sets > len(exercises):
+                steps += f" ({total_sets} sets)"
+            
+            total_duration = workout_data['total_duration']
+            duration = self.format_duration(total_duration) if total_duration > 0 else ''
+        
+        created = workout_data.get('created')
+        created = created.split(' ')[0] if created else ''
+        
+        return {'text': name, 'values': (sport_display, steps, duration, created), 'tags': tags}
+    
+    def _list_parse_worker(self, tree, filepaths):
+        """Fully parse the list view's files in the background, filling rows as they finish.
+        The FIT readers are pure Python and hold the GIL, so large batches are parsed in a
+        process pool; the threads only do the cache lookups and wait on their file's process."""
+        processes = None
+        if len(filepaths) > 1 and self._pending_bytes(filepaths) >= PARSE_POOL_MIN_BYTES:
+            try:
+                processes = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(filepaths)))
+            except (OSError, NotImplementedError):
+                pass  # No process support - parse on the threads
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as executor:
+                futures = {executor.submit(self._get_workout, filepath, processes): filepath
+                           for filepath in filepaths}
+                for future in as_completed(futures):
+                    try:
+                        workout_data = future.result()
+                    except Exception:
+                        workout_data = None
+                    self.root.after(0, self._fill_workout_row, tree, futures[future], workout_data)
+        finally:
+            if processes is not None:
+                processes.shutdown(wait=False)
+    
+    @staticmethod
+    def _pending_bytes(filepaths):
+        """Total size of the files still to be parsed (unreadable ones count as 0)"""
+        total = 0
+        for filepath in filepaths:
+            try:
+                total += os.stat(filepath).st_size
+            except OSError:
+                pass
+        return total
+    
+    def _fill_workout_row(self, tree, filepath, workout_data):
+        """Replace a list row's header-only summary with the parsed workout (on the Tk thread)"""
+        try:
+            if workout_data:
+                tree.item(filepath, **self._workout_row(tree, filepath, workout_data))
+            else:
+                tree.delete(filepath)  # Not a readable workout
+        except:
+            pass  # Widget was destroyed
+    
     def _show_detail_view(self, filepath):
         """Show detailed workout view with back button"""
-        workout_data = self.parse_fit_file(filepath)
+        workout_data = self._get_workout(filepath)
         if not workout_data:
             return
         
@@ -1927,13 +2600,14 @@ You still need to drag them to OpenMTP."""
         preview = self._preview_window
         content = self._preview_content
         
-        preview.title(f"Workout Preview - {workout_data.get('name', 'Workout')}")
+        title = workout_data.get('name', 'Workout')
+        preview.title(f"Workout Preview - {title}")
         
         # Back button header
         header = Frame(content, bg='#1a1a1a')
         header.pack(fill=X, padx=15, pady=(10, 5))
         
-        back_btn = Label(header, text="← Back", font=('SF Pro Text', 12),
+        back_btn = Label(header, text="← Back", font=self.font_large,
                         bg='#1a1a1a', fg='#007AFF', cursor='hand2')
         back_btn.pack(side=LEFT)
         back_btn.bind('<Button-1>', lambda e: self._build_list_view())
@@ -1948,8 +2622,7 @@ You still need to drag them to OpenMTP."""
         watch_frame.pack(fill=BOTH, expand=True, pady=(0, 15))
         
         # Workout title
-        title = workout_data.get('name', 'Workout')
-        Label(watch_frame, text=title, font=('SF Pro Display', 16, 'bold'),
+        Label(watch_frame, text=title, font=self.font_watch_title_large,
               bg='#000', fg='#fff').pack(pady=(5, 5))
         
         # Sport type badge
@@ -1960,7 +2633,7 @@ You still need to drag them to OpenMTP."""
             sport_color = get_sport_color(sport, sub_sport)
 
             sport_badge = Label(watch_frame, text=f"  {sport_display}  ",
-                               font=('SF Pro Text', 10, 'bold'),
+                               font=self.font_caption_bold,
                                bg=sport_color, fg='#fff')
             sport_badge.pack(pady=(0, 5))
 
@@ -1968,19 +2641,10 @@ You still need to drag them to OpenMTP."""
         meta_frame = Frame(watch_frame, bg='#000')
         meta_frame.pack(fill=X, pady=(0, 10))
         
-        meta_parts = []
-        if workout_data.get('source'):
-            meta_parts.append(f"📱 {workout_data['source']}")
-        if workout_data.get('created'):
-            created = workout_data['created'].split(' ')[0] if ' ' in workout_data['created'] else workout_data['created']
-            meta_parts.append(f"📅 {created}")
-        
-        total_duration = sum(ex.get('duration', 0) for ex in workout_data.get('steps', []))
-        if total_duration > 0:
-            meta_parts.append(f"⏱ {self.format_duration(total_duration)}")
-        
-        if meta_parts:
-            Label(meta_frame, text="  •  ".join(meta_parts), font=('SF Pro Text', 9),
+        exercises = workout_data.get('steps', [])
+        meta_text = self._workout_meta_text(workout_data)
+        if meta_text:
+            Label(meta_frame, text=meta_text, font=self.font_small,
                   bg='#000', fg='#666').pack()
         
         # Scrollable exercise list
@@ -1993,32 +2657,24 @@ You still need to drag them to OpenMTP."""
         canvas.pack(side=LEFT, fill=BOTH, expand=True)
         
         canvas_window = canvas.create_window((0, 0), window=exercise_frame, anchor='nw')
+        self._track_scroll_region(canvas, canvas_window, exercise_frame)
         
-        def configure_canvas(event):
-            canvas.configure(scrollregion=canvas.bbox('all'))
-            canvas.itemconfig(canvas_window, width=event.width)
-        
-        exercise_frame.bind('<Configure>', configure_canvas)
-        canvas.bind('<Configure>', lambda e: canvas.itemconfig(canvas_window, width=e.width))
-        
-        # Mouse wheel scrolling
+        # Mouse wheel scrolling - window-level, replaced on each view rebuild
         def on_mousewheel(event):
             if canvas.winfo_exists():
                 canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind("<MouseWheel>", on_mousewheel)
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        preview.bind("<MouseWheel>", on_mousewheel)
         
         # Display exercises
-        exercises = workout_data.get('steps', [])
-        total_sets = 0
+        total_sets = workout_data['total_sets']
         rest_count = 0
 
+        rows = []
         for i, exercise in enumerate(exercises):
-            self.create_exercise_row(exercise_frame, exercise, i, sport)
-            total_sets += exercise.get('sets', 1)
+            rows.append(partial(self.create_exercise_row, exercise_frame, exercise, i, sport))
             if exercise.get('is_rest') or exercise.get('step_type') == 'rest':
                 rest_count += 1
+        self._build_rows_in_slices(exercise_frame, rows)
 
         # Footer stats
         footer = Frame(watch_frame, bg='#000')
@@ -2031,9 +2687,45 @@ You still need to drag them to OpenMTP."""
         if rest_count > 0:
             stats_parts.append(f"{rest_count} rest")
 
-        Label(footer, text=" • ".join(stats_parts), font=('SF Pro Text', 11),
+        Label(footer, text=" • ".join(stats_parts), font=self.font_body,
               bg='#000', fg='#666').pack()
 
+    def _track_scroll_region(self, canvas, canvas_window, frame):
+        """Keep a scrolling canvas sized to its frame. While rows are being added the frame
+        resizes repeatedly; the scrollregion is recomputed once per idle pass, not per resize."""
+        scheduled = False
+
+        def update_scroll_region():
+            nonlocal scheduled
+            scheduled = False
+            try:
+                canvas.configure(scrollregion=canvas.bbox('all'))
+            except:
+                pass  # Widget was destroyed
+
+        def on_frame_configure(event):
+            nonlocal scheduled
+            canvas.itemconfig(canvas_window, width=event.width)
+            if not scheduled:
+                scheduled = True
+                canvas.after_idle(update_scroll_region)
+
+        frame.bind('<Configure>', on_frame_configure)
+        canvas.bind('<Configure>', lambda e: canvas.itemconfig(canvas_window, width=e.width))
+
+    def _build_rows_in_slices(self, parent, rows, start=0):
+        """Run row builders PREVIEW_ROW_CHUNK at a time so the preview paints before long lists finish"""
+        try:
+            if not parent.winfo_exists():
+                return
+        except:
+            return  # Preview was closed or rebuilt
+        end = start + PREVIEW_ROW_CHUNK
+        for build in rows[start:end]:
+            build()
+        if end < len(rows):
+            self.root.after(1, self._build_rows_in_slices, parent, rows, end)
+
     def create_exercise_row(self, parent, exercise, index, sport=None):
         """Create a standalone exercise row (not nested in repeat)"""
         bg_color = '#111'
@@ -2044,77 +2736,107 @@ You still need to drag them to OpenMTP."""
         row.pack(fill=X, pady=2, padx=2)
 
         # Exercise name with icon
-        Label(row, text=f"※  {name}", font=('SF Pro Text', 11, 'bold'),
+        Label(row, text=f"※  {name}", font=self.font_body_bold,
               bg=bg_color, fg='#fff', anchor='w', wraplength=420).pack(fill=X)
 
         # Badges row
-        badges = Frame(row, bg=bg_color)
-        badges.pack(fill=X, pady=(4, 0))
+        badges = []
 
         # Reps badge (green)
         if exercise.get('reps'):
-            self.create_badge(badges, f"{exercise['reps']} reps", "#22c55e")
+            badges.append((f"{exercise['reps']} reps", "#22c55e"))
 
         # Duration badge (blue)
         if exercise.get('duration'):
             duration_str = self.format_duration(exercise['duration'])
-            self.create_badge(badges, duration_str, "#3b82f6")
+            badges.append((duration_str, "#3b82f6"))
         elif duration_type == 'open':
-            self.create_badge(badges, "Lap Button", "#6b7280")
+            badges.append(("Lap Button", "#6b7280"))
 
         # Sets badge (green, only if > 1)
         sets = exercise.get('sets', 1)
         if sets > 1:
-            self.create_badge(badges, f"{sets} sets", "#22c55e")
+            badges.append((f"{sets} sets", "#22c55e"))
 
         # Category badge (gray)
-        category = exercise.get('category', '')
-        if category:
-            try:
-                cat_id = int(category)
-                cat_name = EXERCISE_CATEGORY_NAMES.get(cat_id, '')
-                if cat_name and cat_name.lower() not in name.lower():
-                    Label(badges, text=cat_name, font=('SF Pro Text', 9),
-                          bg='#374151', fg='#d1d5db', padx=6, pady=2).pack(side=LEFT, padx=(0, 5))
-            except (ValueError, TypeError):
-                if category.lower() not in name.lower():
-                    Label(badges, text=category.replace('_', ' ').title(), font=('SF Pro Text', 9),
-                          bg='#374151', fg='#d1d5db', padx=6, pady=2).pack(side=LEFT, padx=(0, 5))
+        category = self._category_badge_text(exercise.get('category', ''), name)
+
+        self.create_badge_strip(row, badges, bg_color, category)
 
     def create_badge(self, parent, text, color):
         """Create a colored badge"""
-        badge = Label(parent, text=text, font=('SF Pro Text', 10, 'bold'),
+        badge = Label(parent, text=text, font=self.font_caption_bold,
                      bg=color, fg='#fff', padx=8, pady=2)
         badge.pack(side=LEFT, padx=(0, 5))
 
+    def create_badge_strip(self, parent, badges, bg, category=None):
+        """Draw a row of (text, color) badges, plus an optional gray category badge,
+        on a single Canvas instead of a Label widget per badge"""
+        styles = [(text, color, self.font_caption_bold, '#fff', 8) for text, color in badges]
+        if category:
+            styles.append((category, '#374151', self.font_small, '#d1d5db', 6))
+        if not styles:
+            return
+
+        # Same box as a Label badge: text plus padx each side, linespace plus pady=2 and border
+        sizes = [self._text_size(font, text) for text, _, font, _, _ in styles]
+        height = max(linespace for _, linespace in sizes) + 6
+        strip = Canvas(parent, bg=bg, height=height, highlightthickness=0, bd=0)
+        x = 0
+        for (text, color, font, fg, padx), (text_width, linespace) in zip(styles, sizes):
+            width = text_width + 2 * padx + 2
+            badge_height = linespace + 6
+            top = (height - badge_height) // 2
+            strip.create_rectangle(x, top, x + width, top + badge_height, fill=color, outline='')
+            strip.create_text(x + padx + 1, height // 2, text=text, fill=fg, font=font, anchor='w')
+            x += width + 5
+        strip.configure(width=x)
+        strip.pack(fill=X, pady=(4, 0))
+
+    def _text_size(self, font, text):
+        """(width, linespace) of text in one of the shared fonts, measured by Tk only once"""
+        key = (font.name, text)
+        size = self._text_sizes.get(key)
+        if size is None:
+            size = self._text_sizes[key] = (font.measure(text), font.metrics('linespace'))
+        return size
+
+    @staticmethod
+    def _category_badge_text(category, name):
+        """Display name for an exercise's category badge, or None if it would repeat the name"""
+        if not category:
+            return None
+        try:
+            cat_name = EXERCISE_CATEGORY_NAMES.get(int(category), '')
+            if cat_name and cat_name.lower() not in name.lower():
+                return cat_name
+        except (ValueError, TypeError):
+            if category.lower() not in name.lower():
+                return pretty_name(category)
+        return None
+
     def create_legend_item(self, parent, icon, text, color):
         """Create a legend item with icon matching app style"""
         item = Frame(parent, bg='#1a1a1a')
         item.pack(side=LEFT, padx=(0, 12))
 
-        Label(item, text=icon, font=('SF Pro Text', 10), bg='#1a1a1a', fg=color).pack(side=LEFT)
-        Label(item, text=f" {text}", font=('SF Pro Text', 9), bg='#1a1a1a', fg='#888').pack(side=LEFT)
+        Label(item, text=icon, font=self.font_caption, bg='#1a1a1a', fg=color).pack(side=LEFT)
+        Label(item, text=f" {text}", font=self.font_small, bg='#1a1a1a', fg='#888').pack(side=LEFT)
 
     def create_legend_badge(self, parent, text, color):
         """Create a legend badge (legacy)"""
         item = Frame(parent, bg='#1a1a1a')
         item.pack(side=LEFT, padx=(0, 15))
 
-        Label(item, text="●", font=('SF Pro Text', 10), bg='#1a1a1a', fg=color).pack(side=LEFT)
-        Label(item, text=text, font=('SF Pro Text', 10), bg='#1a1a1a', fg='#888').pack(side=LEFT, padx=(3, 0))
-    
-    def format_duration(self, seconds):
-        """Format duration in seconds to human readable string"""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{mins}:{secs:02d}" if secs else f"{mins}min"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h {mins}m" if mins else f"{hours}h"
+        Label(item, text="●", font=self.font_caption, bg='#1a1a1a', fg=color).pack(side=LEFT)
+        Label(item, text=text, font=self.font_caption, bg='#1a1a1a', fg='#888').pack(side=LEFT, padx=(3, 0))
+    
+    @staticmethod
+    def format_duration(seconds):
+        """Format duration in seconds to human readable string (table lookup under an hour)"""
+        if 0 <= seconds < 3600:
+            return DURATION_TEXT[int(seconds)]
+        return _format_duration_text(seconds)
     
     def format_distance(self, meters):
         """Format distance in meters to human readable string"""
@@ -2124,9 +2846,10 @@ You still need to drag them to OpenMTP."""
             km = meters / 1000
             return f"{km:.1f}km"
 
-    def validate_fit_file(self, filepath):
+    def validate_fit_file(self, filepath, workout_data=None):
         """Validate FIT file for issues that may prevent it from working on Garmin watches.
-        Returns dict with 'valid' boolean and 'issues' list."""
+        Returns dict with 'valid' boolean and 'issues' list. Pass the parsed workout_data
+        to reuse the categories the parser already checked instead of decoding again."""
         # Try fitfiletool's validator first
         if FITFILETOOL_AVAILABLE:
             result = fitfiletool_validate_fit_file(filepath)
@@ -2136,23 +2859,21 @@ You still need to drag them to OpenMTP."""
             return result
 
         # Fall back to local validation
-        if not FITPARSE_AVAILABLE:
+        if not (FITDECODE_AVAILABLE or FITPARSE_AVAILABLE):
             return {'valid': True, 'issues': [], 'warnings': [], 'invalid_categories': []}
 
         try:
-            fitfile = FitFile(filepath)
             issues = []
-            invalid_categories = []
-
-            # Valid FIT SDK exercise categories are 0-32
-            VALID_CATEGORIES = set(range(33))
-
-            for record in fitfile.get_messages('workout_step'):
-                for field in record.fields:
-                    if field.name == 'exercise_category' and field.value is not None:
-                        # Check if it's a raw number (invalid) vs named category
-                        if isinstance(field.value, int) and field.value not in VALID_CATEGORIES:
-                            invalid_categories.append(field.value)
+            if workout_data and 'invalid_categories' in workout_data:
+                invalid_categories = workout_data['invalid_categories']
+            else:
+                invalid_categories = []
+                for record in iter_fit_messages(filepath, ('workout_step',)):
+                    for field in record.fields:
+                        if field.name == 'exercise_category' and field.value is not None:
+                            # Check if it's a raw number (invalid) vs named category
+                            if isinstance(field.value, int) and field.value not in VALID_EXERCISE_CATEGORIES:
+                                invalid_categories.append(field.value)
 
             if invalid_categories:
                 unique_invalid = list(set(invalid_categories))
@@ -2222,24 +2943,161 @@ You still need to drag them to OpenMTP."""
         except Exception as e:
             return None, f"Error repairing file: {str(e)}"
 
-    def parse_fit_file(self, filepath):
+    @staticmethod
+    def _workout_key(filepath):
+        """Cache key for a FIT file - (path, mtime_ns, size), or None if it's unreadable"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return (filepath, st.st_mtime_ns, st.st_size)
+    
+    def _workout_is_cached(self, filepath):
+        """Check whether _get_workout would return without parsing"""
+        with self._fit_cache_lock:
+            return self._workout_key(filepath) in self._fit_cache
+    
+    def _get_workout(self, filepath, processes=None):
+        """Parse a FIT file, reusing the result while the file is unchanged.
+        With a ProcessPoolExecutor the parse itself runs in a worker process."""
+        key = self._workout_key(filepath)
+        if key is None:
+            return None
+        cache = self._fit_cache
+        with self._fit_cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        fingerprint = self._workout_fingerprint(filepath, key[2])
+        workout_data = self._load_parsed_workout(fingerprint) if fingerprint else None
+        if workout_data is None:
+            try:
+                if processes is None:
+                    raise RuntimeError
+                workout_data = processes.submit(self.parse_fit_file, filepath).result()
+            except Exception:
+                # No pool, or the pool broke (e.g. a worker died) - parse here instead
+                workout_data = self.parse_fit_file(filepath)
+            # Only full parses are persisted; a basic-scan fallback is redone next run
+            if workout_data and fingerprint and workout_data.get('parser') != 'basic':
+                self._save_parsed_workout(fingerprint, workout_data)
+        with self._fit_cache_lock:
+            cache[key] = workout_data
+            if len(cache) > FIT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return workout_data
+    
+    @staticmethod
+    def _workout_fingerprint(filepath, size):
+        """Content fingerprint for the disk cache: size, the first 4 KB and the last
+        two bytes (the FIT file CRC), or None if the file can't be read"""
+        import hashlib
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        try:
+            with open(filepath, 'rb') as f:
+                digest.update(f.read(PARSED_CACHE_HEAD_BYTES))
+                if size > PARSED_CACHE_HEAD_BYTES:
+                    f.seek(-2, os.SEEK_END)
+                    digest.update(f.read(2))
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _load_parsed_workout(fingerprint):
+        """Load a parsed workout from the disk cache, or None"""
+        import json
+        try:
+            with open(PARSED_CACHE_DIR / f"{fingerprint}.json") as f:
+                entry = json.load(f)
+            if entry.get('version') == PARSED_CACHE_VERSION:
+                return entry.get('workout')
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
+    
+    @staticmethod
+    def _save_parsed_workout(fingerprint, workout_data):
+        """Persist a parsed workout (best effort, written atomically)"""
+        import json
+        entry = {'version': PARSED_CACHE_VERSION, 'workout': workout_data}
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError):
+            return  # Not JSON-serializable - keep it in memory only
+        try:
+            write_file_atomic(PARSED_CACHE_DIR / f"{fingerprint}.json", data)
+        except OSError:
+            pass
+    
+    @classmethod
+    def parse_fit_file(cls, filepath):
         """Parse a FIT file and extract workout data"""
+        workout_data = None
         # Try fitfiletool's parser first (uses fitparse internally)
         if FITFILETOOL_AVAILABLE:
-            result = fitfiletool_parse_fit_file(filepath)
-            if result:
-                return result
-        # Fall back to local fitparse implementation
-        if FITPARSE_AVAILABLE:
-            return self.parse_fit_with_fitparse(filepath)
-        # Last resort: basic binary parsing
-        return self.parse_fit_basic(filepath)
-    
-    def parse_fit_with_fitparse(self, filepath):
-        """Parse FIT file using fitparse library"""
+            workout_data = fitfiletool_parse_fit_file(filepath)
+        if not workout_data:
+            # Fall back to local fitdecode/fitparse implementation, last resort basic binary parsing
+            if FITDECODE_AVAILABLE or FITPARSE_AVAILABLE:
+                workout_data = cls.parse_fit_with_fitparse(filepath)
+            else:
+                workout_data = cls.parse_fit_basic(filepath)
+        
+        # Totals shown by every preview, computed once per parse
+        if workout_data:
+            steps = workout_data.get('steps', [])
+            workout_data['total_duration'] = sum(map(step_duration, steps))
+            workout_data['total_sets'] = sum(map(step_sets, steps))
+        return workout_data
+    
+    @staticmethod
+    def _apply_fit_header(workout_data, name, fields):
+        """Copy the fields of a workout or file_id message into workout_data"""
+        if name == 'workout':
+            # Workout name and sport type
+            value = fields.get('wkt_name')
+            if value:
+                workout_data['name'] = value
+            value = fields.get('sport')
+            if value:
+                workout_data['sport'] = str(value)
+            value = fields.get('sub_sport')
+            if value:
+                workout_data['sub_sport'] = str(value)
+        else:
+            # file_id - file metadata
+            value = fields.get('time_created')
+            if value:
+                workout_data['created'] = str(value)
+            value = fields.get('manufacturer')
+            if value:
+                workout_data['manufacturer'] = str(value)
+            value = fields.get('garmin_product')
+            if value:
+                workout_data['source'] = pretty_name(str(value))
+    
+    @classmethod
+    def parse_fit_metadata(cls, filepath):
+        """Read only a workout's name, sport and file info (no steps), or None.
+        Stops at the first workout step, so it's cheap even for long workouts."""
+        if not (FITDECODE_AVAILABLE or FITPARSE_AVAILABLE):
+            return None
+        try:
+            workout_data = {'name': 'Workout', 'sport': None, 'created': None, 'source': None}
+            for record in iter_fit_messages(filepath, FIT_METADATA_MESSAGES):
+                if record.name == 'workout_step':
+                    break
+                fields = {field.name: field.value for field in record.fields}
+                cls._apply_fit_header(workout_data, record.name, fields)
+            return workout_data
+        except Exception:
+            return None
+    
+    @classmethod
+    def parse_fit_with_fitparse(cls, filepath):
+        """Parse FIT file using fitdecode (or fitparse if that's all that is installed)"""
         try:
-            fitfile = FitFile(filepath)
-            
             workout_data = {
                 'name': 'Workout',
                 'sport': None,
@@ -2248,115 +3106,101 @@ You still need to drag them to OpenMTP."""
                 'source': None
             }
             
-            # Get file metadata
-            for record in fitfile.get_messages('file_id'):
-                for field in record.fields:
-                    if field.name == 'time_created' and field.value:
-                        workout_data['created'] = str(field.value)
-                    elif field.name == 'manufacturer' and field.value:
-                        workout_data['manufacturer'] = str(field.value)
-                    elif field.name == 'garmin_product' and field.value:
-                        workout_data['source'] = str(field.value).replace('_', ' ').title()
-            
-            # First pass: collect exercise titles for lookup (strength workouts)
+            # Single walk over the messages we use, classified by name
+            # (exercise titles and sport are only consumed after the loop)
             exercise_titles = {}
-            for record in fitfile.get_messages('exercise_title'):
-                title_data = {}
-                for field in record.fields:
-                    if field.name == 'wkt_step_name':
-                        title_data['name'] = field.value
-                    elif field.name == 'exercise_category':
-                        title_data['category'] = str(field.value) if field.value else None
-                    elif field.name == 'exercise_name':
-                        title_data['exercise_id'] = field.value
-                
-                if title_data.get('category') and title_data.get('name'):
-                    key = (title_data.get('category'), title_data.get('exercise_id'))
-                    exercise_titles[key] = title_data['name']
-                    exercise_titles[title_data.get('category')] = title_data['name']
-            
-            # Get workout name and sport type
-            for record in fitfile.get_messages('workout'):
-                for field in record.fields:
-                    if field.name == 'wkt_name' and field.value:
-                        workout_data['name'] = field.value
-                    elif field.name == 'sport' and field.value:
-                        workout_data['sport'] = str(field.value)
-                    elif field.name == 'sub_sport' and field.value:
-                        workout_data['sub_sport'] = str(field.value)
-            
-            # Second pass: get workout steps
             steps_raw = []
-            for record in fitfile.get_messages('workout_step'):
-                step = {'is_rest': False, 'is_repeat': False}
-                for field in record.fields:
-                    if field.name == 'wkt_step_name' and field.value:
-                        step['name'] = field.value
-                    elif field.name == 'exercise_category' and field.value:
-                        step['category'] = str(field.value)
-                    elif field.name == 'exercise_name':
-                        step['exercise_id'] = field.value
-                    elif field.name == 'duration_type':
-                        dtype_str = str(field.value) if field.value else ''
+            invalid_categories = []  # Collected here so validate_fit_file needn't decode again
+            for record in iter_fit_messages(filepath, FIT_WORKOUT_MESSAGES):
+                name = record.name
+                # One dict per message, then direct key lookups (no per-field elif chain)
+                fields = {field.name: field.value for field in record.fields}
+                
+                if name == 'workout_step':
+                    step = {'is_rest': False, 'is_repeat': False}
+                    value = fields.get('wkt_step_name')
+                    if value:
+                        step['name'] = value
+                    value = fields.get('exercise_category')
+                    if value:
+                        step['category'] = str(value)
+                    # Check if it's a raw number (invalid) vs named category
+                    if isinstance(value, int) and value not in VALID_EXERCISE_CATEGORIES:
+                        invalid_categories.append(value)
+                    if 'exercise_name' in fields:
+                        step['exercise_id'] = fields['exercise_name']
+                    if 'duration_type' in fields:
+                        value = fields['duration_type']
+                        # Older FIT profiles leave newer types (e.g. 28 = reps) as raw numbers
+                        if type(value) is int and 0 <= value < len(DURATION_TYPE_NAMES):
+                            value = DURATION_TYPE_NAMES[value] or value
+                        dtype_str = str(value) if value else ''
                         step['duration_type'] = dtype_str
                         # FIT SDK: repeat types indicate this is a repeat step
                         # repeat_until_steps_cmplt=6, repeat_until_time=7, etc.
                         if 'repeat' in dtype_str.lower() or dtype_str in ('6', '7', '8', '9'):
                             step['is_repeat'] = True
-                    elif field.name == 'duration_step' and field.value is not None:
-                        # This is which step to repeat back to (for repeat steps)
-                        step['duration_step'] = int(field.value)
-                    elif field.name == 'duration_value' and field.value is not None:
+                    value = fields.get('duration_value')
+                    if value is not None and step['is_repeat']:
                         # For repeat steps, this is the repeat count
-                        if step.get('is_repeat'):
-                            step['repeat_count'] = int(field.value)
-                    elif field.name == 'duration_reps' and field.value:
-                        step['reps'] = int(field.value)
-                    elif field.name == 'duration_time' and field.value:
-                        step['duration'] = float(field.value)
-                    elif field.name == 'duration_distance' and field.value:
-                        step['distance'] = float(field.value)
-                    elif field.name == 'intensity':
-                        intensity_raw = field.value
-                        intensity = str(intensity_raw) if intensity_raw is not None else None
-                        step['intensity'] = intensity
-                        # FIT SDK intensity: 0=active, 1=rest, 2=warmup, 3=cooldown
-                        # fitparse may return string or numeric
-                        if intensity in ('rest', '1', 1):
+                        step['repeat_count'] = int(value)
+                    value = fields.get('duration_reps')
+                    if value:
+                        step['reps'] = int(value)
+                    value = fields.get('duration_time')
+                    if value:
+                        step['duration'] = float(value)
+                    value = fields.get('duration_distance')
+                    if value:
+                        step['distance'] = float(value)
+                    if 'intensity' in fields:
+                        # Kept raw (name or number) and compared against both forms
+                        intensity = step['intensity'] = fields['intensity']
+                        if intensity in INTENSITY_REST:
                             step['is_rest'] = True
-                        elif intensity in ('warmup', '2', 2):
+                        elif intensity in INTENSITY_WARMUP:
                             step['is_warmup'] = True
-                    elif field.name == 'repeat_steps' and field.value:
-                        step['is_repeat'] = True
-                        step['repeat_count'] = int(field.value)
-                    elif field.name == 'exercise_weight' and field.value:
-                        step['weight'] = float(field.value)
-                    elif field.name == 'weight_display_unit':
-                        step['weight_unit'] = str(field.value) if field.value else 'kg'
-                    elif field.name == 'notes' and field.value:
-                        step['notes'] = field.value
-                    elif field.name == 'target_type' and field.value:
-                        step['target_type'] = str(field.value)
-                    elif field.name == 'target_value' and field.value:
-                        step['target_value'] = field.value
+                    value = fields.get('repeat_steps')
+                    if value:
+                        step['repeat_count'] = int(value)
+                    value = fields.get('exercise_weight')
+                    if value:
+                        step['weight'] = float(value)
+                    if 'weight_display_unit' in fields:
+                        value = fields['weight_display_unit']
+                        step['weight_unit'] = str(value) if value else 'kg'
+                    value = fields.get('notes')
+                    if value:
+                        step['notes'] = value
+                    
+                    steps_raw.append(step)
                 
-                steps_raw.append(step)
+                elif name == 'exercise_title':
+                    # Exercise titles for name lookup (strength workouts)
+                    title = fields.get('wkt_step_name')
+                    category = fields.get('exercise_category')
+                    category = str(category) if category else None
+                    if category and title:
+                        exercise_titles[(category, fields.get('exercise_name'))] = title
+                        exercise_titles[category] = title
+                
+                else:
+                    # workout / file_id
+                    cls._apply_fit_header(workout_data, name, fields)
             
             # Determine if this is a cardio workout (running, cycling, etc.) vs strength
             sport_lower = (workout_data.get('sport') or '').lower()
             sub_sport_lower = (workout_data.get('sub_sport') or '').lower()
-            cardio_sports = ['running', 'cycling', 'swimming', 'walking', 'hiking', 'run', 'bike', 'swim', 'walk', 'hike', 'cardio', 'trail_running', 'treadmill']
-            is_cardio = sport_lower in cardio_sports or sub_sport_lower in cardio_sports or 'run' in sport_lower or 'run' in sub_sport_lower
+            is_cardio = sport_lower in CARDIO_SPORTS or sub_sport_lower in CARDIO_SPORTS or 'run' in sport_lower or 'run' in sub_sport_lower
+            sport_name = (workout_data.get('sport') or 'exercise').title()
             
-            # Third pass: process steps
+            # Process steps in a single pass
             # Keep rest and repeat steps as separate entries for grouped display
             exercises = []
-            i = 0
-            while i < len(steps_raw):
-                step = steps_raw[i]
-
+            last_exercise = None  # latest entry a repeat marker can set 'sets' on
+            for step in steps_raw:
                 # Handle repeat markers - keep as separate step for grouped display
-                if step.get('is_repeat'):
+                if step['is_repeat']:
                     repeat_step = {
                         'is_repeat': True,
                         'repeat_count': step.get('repeat_count', 0),
@@ -2364,30 +3208,27 @@ You still need to drag them to OpenMTP."""
                         'step_type': 'repeat'
                     }
                     # Also update previous exercise's sets for badge display
-                    if exercises and step.get('repeat_count'):
-                        for ex in reversed(exercises):
-                            if not ex.get('is_rest') and not ex.get('is_repeat'):
-                                ex['sets'] = step['repeat_count']
-                                break
+                    if last_exercise is not None and step.get('repeat_count'):
+                        last_exercise['sets'] = step['repeat_count']
                     exercises.append(repeat_step)
-                    i += 1
                     continue
 
                 # Handle rest steps - keep as separate entries for grouped display
-                if step.get('is_rest'):
+                duration_type = step.get('duration_type')
+                if step['is_rest']:
+                    duration = step.get('duration', 0)
                     rest_step = {
                         'is_rest': True,
                         'step_type': 'rest',
                         'name': 'Rest',
                         'duration_type': step.get('duration_type', 'time'),
-                        'rest_seconds': step.get('duration', 0),
-                        'duration': step.get('duration', 0),
+                        'rest_seconds': duration,
+                        'duration': duration,
                         'category': step.get('category')
                     }
-                    if step.get('duration_type') in ('open', 'repeat_until_steps_cmplt'):
+                    if duration_type in ('open', 'repeat_until_steps_cmplt'):
                         rest_step['duration_type'] = 'open'
                     exercises.append(rest_step)
-                    i += 1
                     continue
 
                 # Handle warmup steps - keep as separate entries
@@ -2399,10 +3240,10 @@ You still need to drag them to OpenMTP."""
                         'duration': step.get('duration', 0),
                         'category': step.get('category')
                     }
-                    if step.get('duration_type') in ('open', 'repeat_until_steps_cmplt'):
+                    if duration_type in ('open', 'repeat_until_steps_cmplt'):
                         warmup_step['duration_type'] = 'open'
                     exercises.append(warmup_step)
-                    i += 1
+                    last_exercise = warmup_step
                     continue
 
                 exercise = {}
@@ -2414,19 +3255,16 @@ You still need to drag them to OpenMTP."""
                 # Build step name based on workout type
                 if is_cardio:
                     # For cardio workouts, use intensity + notes
-                    sport_name = workout_data.get('sport', 'exercise').title()
-
-                    # FIT SDK intensity: 0=active, 1=rest, 2=warmup, 3=cooldown
-                    if intensity in ('warmup', '2', 2):
+                    if intensity in INTENSITY_WARMUP:
                         exercise['name'] = 'Warm Up'
                         exercise['step_type'] = 'warmup'
-                    elif intensity in ('cooldown', '3', 3):
+                    elif intensity in INTENSITY_COOLDOWN:
                         exercise['name'] = 'Cool Down'
                         exercise['step_type'] = 'cooldown'
-                    elif intensity in ('rest', '1', 1):
+                    elif intensity in INTENSITY_REST:
                         exercise['name'] = 'Recovery'
                         exercise['step_type'] = 'rest'
-                    elif intensity in ('active', '0', 0):
+                    elif intensity in INTENSITY_ACTIVE:
                         exercise['name'] = notes if notes else sport_name
                         exercise['step_type'] = 'active'
                     else:
@@ -2445,7 +3283,7 @@ You still need to drag them to OpenMTP."""
                     elif cat and cat in exercise_titles:
                         exercise['name'] = exercise_titles[cat]
                     elif cat:
-                        exercise['name'] = cat.replace('_', ' ').title()
+                        exercise['name'] = pretty_name(cat)
                     else:
                         exercise['name'] = 'Exercise'
                 
@@ -2463,79 +3301,82 @@ You still need to drag them to OpenMTP."""
                         exercise['weight'] = f"{weight:.0f} lbs"
                     else:
                         exercise['weight'] = f"{weight:.1f} kg"
-                if step.get('notes') and is_cardio:
-                    exercise['zone'] = step['notes']
+                if notes and is_cardio:
+                    exercise['zone'] = notes
                 
                 exercise['sets'] = 1
-                exercise['type'] = cat.replace('_', ' ').title() if cat else ''
+                exercise['type'] = pretty_name(cat) if cat else ''
                 exercise['category'] = cat  # Keep original category for display lookup
 
                 exercises.append(exercise)
-                i += 1
+                last_exercise = exercise
             
             workout_data['steps'] = exercises
+            workout_data['invalid_categories'] = invalid_categories
             return workout_data if exercises else None
             
         except Exception as e:
             # Silently fall back to basic parsing
-            return self.parse_fit_basic(filepath)
+            return cls.parse_fit_basic(filepath)
     
-    def parse_fit_basic(self, filepath):
+    @classmethod
+    def parse_fit_basic(cls, filepath):
         """Basic FIT file parsing without fitparse library"""
         try:
             with open(filepath, 'rb') as f:
-                data = f.read()
-            
-            # Check FIT header
-            if len(data) < 14:
-                return None
-            
-            header_size = data[0]
-            if header_size < 12:
-                return None
-            
-            # Check for ".FIT" signature
-            if data[8:12] != b'.FIT':
-                return None
-            
-            # Basic parsing - look for workout name in data
-            workout_data = {
-                'name': 'Workout',
-                'steps': []
-            }
-            
-            # Try to find readable strings that might be workout/exercise names
-            # This is a simplified approach
-            text_start = None
-            for i in range(header_size, len(data) - 4):
-                # Look for printable ASCII sequences
-                if 32 <= data[i] <= 126:
-                    if text_start is None:
-                        text_start = i
-                else:
-                    if text_start is not None and i - text_start >= 4:
-                        text = data[text_start:i].decode('ascii', errors='ignore')
-                        # Filter for likely workout/exercise names
-                        if len(text) >= 4 and not text.startswith(('.', '/', '\\')):
-                            if any(kw in text.lower() for kw in ['workout', 'exercise', 'run', 'bike', 'swim', 'strength']):
-                                if not workout_data['steps']:
-                                    workout_data['name'] = text
-                            elif len(text) < 30:
-                                workout_data['steps'].append({'name': text, 'type': 'exercise'})
-                    text_start = None
-            
-            # If we couldn't parse steps, create a placeholder
-            if not workout_data['steps']:
-                workout_data['steps'] = [
-                    {'name': 'Workout content', 'type': 'workout'},
-                    {'name': '(Install fitparse for detailed view)', 'type': 'info'}
-                ]
-            
-            return workout_data
-            
+                # Small files are cheaper to read; large ones are scanned in place
+                if os.fstat(f.fileno()).st_size < FIT_MMAP_MIN_SIZE:
+                    return cls._parse_fit_basic_data(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return cls._parse_fit_basic_data(data)
         except Exception as e:
             # Silently return None for invalid files
             return None
+    
+    @staticmethod
+    def _parse_fit_basic_data(data):
+        """Scan FIT file contents (bytes or mmap) for workout/exercise names"""
+        # Check FIT header
+        if len(data) < 14:
+            return None
+        
+        header_size = data[0]
+        if header_size < 12:
+            return None
+        
+        # Check for ".FIT" signature
+        if data[8:12] != b'.FIT':
+            return None
+        
+        # Basic parsing - look for workout name in data
+        workout_data = {
+            'name': 'Workout',
+            'steps': [],
+            'parser': 'basic'  # degraded result - never persisted to the disk cache
+        }
+        
+        # Try to find readable strings that might be workout/exercise names
+        # This is a simplified approach
+        # (one regex scan in C instead of a per-byte Python loop)
+        for match in FIT_TEXT_RUN_RE.finditer(data, header_size, len(data) - 4):
+            start, end = match.span()
+            # Filter for likely workout/exercise names
+            if data[start] in b'./\\':
+                continue
+            if FIT_NAME_KEYWORD_RE.search(data, start, end):
+                if not workout_data['steps']:
+                    workout_data['name'] = match.group().decode('ascii')
+            elif end - start < 30:
+                workout_data['steps'].append({'name': match.group().decode('ascii'), 'type': 'exercise'})
+        
+        # If we couldn't parse steps, create a placeholder
+        if not workout_data['steps']:
+            workout_data['steps'] = [
+                {'name': 'Workout content', 'type': 'workout'},
+                {'name': '(Install fitparse for detailed view)', 'type': 'info'}
+            ]
+        
+        return workout_data
 
 
     # =========================================================================
@@ -2548,18 +3389,18 @@ You still need to drag them to OpenMTP."""
 
         # Description
         Label(parent, text="Install .PRG files (Connect IQ apps) directly to your Garmin",
-              font=('SF Pro Text', 11), bg='#fff', fg='#666').pack(anchor=W)
+              font=self.font_body, bg='#fff', fg='#666').pack(anchor=W)
 
         # File selection row
         file_row = Frame(parent, bg='#fff')
         file_row.pack(fill=X, pady=(10, 0))
 
         self.prg_file_label = Label(file_row, text="No file selected",
-                                    font=('SF Pro Text', 11), bg='#f8f8f8',
+                                    font=self.font_body, bg='#f8f8f8',
                                     fg='#666', padx=10, pady=6, anchor=W)
         self.prg_file_label.pack(side=LEFT, fill=X, expand=True)
 
-        Button(file_row, text="Browse...", font=('SF Pro Text', 11),
+        Button(file_row, text="Browse...", font=self.font_body,
                command=self.browse_prg_file, padx=10, pady=4,
                relief=FLAT, cursor='hand2').pack(side=RIGHT, padx=(8, 0))
 
@@ -2577,10 +3418,10 @@ You still need to drag them to OpenMTP."""
         mount_row.pack(fill=X, pady=(10, 0))
 
         self.mount_status_label = Label(mount_row, text="🔍 Checking for Garmin mount...",
-                                        font=('SF Pro Text', 11), bg='#fff', fg='#666')
+                                        font=self.font_body, bg='#fff', fg='#666')
         self.mount_status_label.pack(side=LEFT)
 
-        Button(mount_row, text="↻", font=('SF Pro Text', 12),
+        Button(mount_row, text="↻", font=self.font_large,
                command=self.refresh_garmin_mount, padx=6, pady=2,
                relief=FLAT, cursor='hand2').pack(side=RIGHT)
 
@@ -2589,7 +3430,7 @@ You still need to drag them to OpenMTP."""
         btn_row.pack(fill=X, pady=(10, 0))
 
         self.install_prg_btn = Button(btn_row, text="Install to Watch",
-                                      font=('SF Pro Text', 12, 'bold'),
+                                      font=self.font_large_bold,
                                       bg='#007AFF', fg='white',
                                       command=self.install_prg_file,
                                       padx=20, pady=8, relief=FLAT,
@@ -2597,7 +3438,7 @@ You still need to drag them to OpenMTP."""
         self.install_prg_btn.pack(side=LEFT)
 
         self.install_status_label = Label(btn_row, text="",
-                                          font=('SF Pro Text', 11), bg='#fff', fg='#666')
+                                          font=self.font_body, bg='#fff', fg='#666')
         self.install_status_label.pack(side=LEFT, padx=(10, 0))
 
         # Check for Garmin mount
@@ -2606,7 +3447,7 @@ You still need to drag them to OpenMTP."""
     def browse_prg_file(self):
         """Open file dialog to select a .PRG file"""
         try:
-            initial_dir = str(self.prg_build_folder) if self.prg_build_folder.exists() else str(Path.home())
+            initial_dir = str(self.prg_build_folder) if self.prg_build_folder.exists() else str(HOME)
 
             # Force focus to root window before opening dialog
             self.root.focus_force()
@@ -2702,7 +3543,7 @@ You still need to drag them to OpenMTP."""
                 # Show OpenMTP button for manual install
                 if not hasattr(self, 'mtp_install_btn'):
                     self.mtp_install_btn = Button(self.connectiq_frame, text="Open with OpenMTP",
-                                                   font=('SF Pro Text', 11),
+                                                   font=self.font_body,
                                                    command=self._open_prg_with_openmtp,
                                                    padx=10, pady=4, relief=FLAT, cursor='hand2')
                 self.mtp_install_btn.pack(anchor=W, pady=(8, 0))
@@ -2720,7 +3561,7 @@ You still need to drag them to OpenMTP."""
         """Open OpenMTP and the .prg file location for manual installation"""
         if self.selected_prg_file and self.selected_prg_file.exists():
             # Open the folder containing the .prg file
-            subprocess.run(['open', '-R', str(self.selected_prg_file)])
+            launch_detached(['open', '-R', str(self.selected_prg_file)])
         # Open OpenMTP
         self.open_openmtp()
         messagebox.showinfo(
@@ -2791,8 +3632,7 @@ def main():
     else:
         root = Tk()
     
-    # Center on screen
-    root.update_idletasks()
+    # Center on screen (screen metrics don't need an idle flush of our widgets)
     x = (root.winfo_screenwidth() - 580) // 2
     y = (root.winfo_screenheight() - 620) // 2
     root.geometry(f"+{x}+{y}")
@@ -2805,4 +3645,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Worker processes of the list view's parse pool start here in the frozen app
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
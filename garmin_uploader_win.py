@@ -158,6 +158,7 @@ class GarminUploaderWin:
         self.staging_folder.mkdir(exist_ok=True)
         
         self.selected_files = []
+        self._selected_set = set()  # Mirrors selected_files for O(1) dedup
         self.close_ge_btn = None
         self._monitor_running = True
         self.garmin_drive = None
@@ -550,19 +551,28 @@ class GarminUploaderWin:
     
     def add_files(self):
         files = filedialog.askopenfilenames(title="Select .FIT Files", filetypes=[("FIT files", "*.fit *.FIT"), ("All files", "*.*")])
-        if files:
-            if not self.selected_files:
-                self.file_listbox.delete(0, END)
-                self.file_listbox.config(fg='black')
-            for f in files:
-                if f not in self.selected_files:
-                    self.selected_files.append(f)
-                    self.file_listbox.insert(END, f"  📄 {os.path.basename(f)}")
-            self.file_count.config(text=f"{len(self.selected_files)} file(s) selected")
-            self.transfer_btn.config(state=NORMAL)
+        self.add_files_to_list(files)
+    
+    def add_files_to_list(self, files, suffix=""):
+        if not files:
+            return
+        if not self.selected_files:
+            self.file_listbox.delete(0, END)
+            self.file_listbox.config(fg='black')
+        rows = []
+        for f in files:
+            if f not in self._selected_set:
+                self._selected_set.add(f)
+                self.selected_files.append(f)
+                rows.append(f"  📄 {os.path.basename(f)}{suffix}")
+        if rows:
+            self.file_listbox.insert(END, *rows)  # One Tcl call for the whole batch
+        self.file_count.config(text=f"{len(self.selected_files)} file(s) selected")
+        self.transfer_btn.config(state=NORMAL)
     
     def clear_files(self):
         self.selected_files = []
+        self._selected_set = set()
         self.file_listbox.delete(0, END)
         self.file_listbox.insert(END, "  Click 'Add Files' to select .FIT files")
         self.file_listbox.config(fg='#999')
@@ -635,10 +645,7 @@ class GarminUploaderWin:
                         messagebox.showinfo("Repaired",
                             f"Workout repaired and saved to:\n{os.path.basename(new_file)}\n\n"
                             "The repaired file uses valid exercise categories that work on all Garmin watches.")
-                        if new_file not in self.selected_files:
-                            self.selected_files.append(new_file)
-                            self.file_listbox.insert(END, f"  📄 {os.path.basename(new_file)} (repaired)")
-                            self.file_count.config(text=f"{len(self.selected_files)} file(s) selected")
+                        self.add_files_to_list([new_file], suffix=" (repaired)")
                     else:
                         messagebox.showerror("Error", f"Could not repair file:\n{error}")
 